@@ -4,7 +4,6 @@ from typing import Optional
 from app.services.analytics_service import AnalyticsService
 
 router = APIRouter()
-analytics_service = AnalyticsService()
 
 
 @router.get("/campaigns/{campaign_id}", response_model=dict)
@@ -14,7 +13,7 @@ async def get_campaign_analytics(
     """
     Campaign performance analytics
     """
-    analytics = await analytics_service.get_campaign_analytics(None, campaign_id)
+    analytics = await AnalyticsService.get_campaign_analytics(campaign_id)
     if not analytics:
         raise HTTPException(status_code=404, detail="Campaign not found or analytics not available")
     
@@ -26,7 +25,7 @@ async def get_analytics_dashboard():
     """
     Overall platform analytics
     """
-    dashboard = await analytics_service.get_analytics_dashboard(None)
+    dashboard = await AnalyticsService.get_analytics_dashboard()
     if not dashboard:
         raise HTTPException(status_code=500, detail="Failed to generate analytics dashboard")
     
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, Path, Body
+from fastapi import APIRouter, Depends, HTTPException, Query, Path, Body, Response
 from typing import List, Optional, Dict, Any
 
 from app.schemas.campaign import (
@@ -6,6 +6,7 @@ from app.schemas.campaign import (
     SelectInfluencer, MatchAnalysisRequest, MatchAnalysisResponse
 )
 from app.services.campaign_service import CampaignService
+from app.services.supabase_service import next_cursor, valid_cursor
 
 router = APIRouter()
 
@@ -22,14 +23,22 @@ async def create_campaign(
 
 @router.get("/", response_model=List[Dict[str, Any]])
 async def get_campaigns(
+    response: Response,
     status: Optional[str] = None,
     limit: int = Query(20, ge=1, le=100),
-    offset: int = Query(0, ge=0)
+    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Depends(valid_cursor)
 ):
     """
-    List all campaigns
+    List all campaigns, newest first
+    Pass the X-Next-Cursor header of a page back as cursor to fetch the next one
     """
-    return await CampaignService.get_campaigns(skip=offset, limit=limit, status=status)
+    campaigns = await CampaignService.get_campaigns(skip=offset, limit=limit, status=status, cursor=cursor)
+    
+    if cursor_token := next_cursor(campaigns, limit):
+        response.headers["X-Next-Cursor"] = cursor_token
+    
+    return campaigns
 
 
 @router.get("/{campaign_id}", response_model=Dict[str, Any])
@@ -82,9 +91,7 @@ async def select_influencer_for_campaign(
     Select influencer for campaign and move to outreach
     """
     # This functionality still needs to be migrated to Supabase
-    campaign_service = CampaignService()
-    result = await campaign_service.select_influencer(
-        None,  # Passing None instead of db session 
+    result = await CampaignService.select_influencer(
         campaign_id, 
         influencer_data.influencer_id, 
         influencer_data.notes
@@ -105,9 +112,7 @@ async def analyze_campaign_influencer_match(
     Get AI-powered match analysis for campaign and influencer
     """
     # This functionality still needs to be migrated to Supabase
-    campaign_service = CampaignService()
-    analysis = await campaign_service.ai_match_analysis(
-        None,  # Passing None instead of db session
+    analysis = await CampaignService.ai_match_analysis(
         campaign_id, 
         match_request.influencer_id
     )
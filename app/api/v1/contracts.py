@@ -1,8 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, Path
+from fastapi import APIRouter, Depends, HTTPException, Query, Path, Response
 from typing import List, Dict, Any, Optional
 
 from app.schemas.contract import ContractCreate, ContractUpdate, ContractList, Contract
 from app.services.contract_service import ContractService
+from app.services.supabase_service import next_cursor, valid_cursor
 
 router = APIRouter()
 
@@ -19,22 +20,31 @@ async def create_contract(
 
 @router.get("/", response_model=List[Dict[str, Any]])
 async def get_contracts(
+    response: Response,
     campaign_id: Optional[str] = None,
     creator_id: Optional[str] = None,
     status: Optional[str] = None,
     limit: int = Query(20, ge=1, le=100),
-    offset: int = Query(0, ge=0)
+    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Depends(valid_cursor)
 ):
     """
-    List all contracts
+    List all contracts, newest first
+    Pass the X-Next-Cursor header of a page back as cursor to fetch the next one
     """
-    return await ContractService.get_contracts(
+    contracts = await ContractService.get_contracts(
         skip=offset, 
         limit=limit, 
         campaign_id=campaign_id, 
         creator_id=creator_id, 
-        status=status
+        status=status,
+        cursor=cursor
     )
+    
+    if cursor_token := next_cursor(contracts, limit):
+        response.headers["X-Next-Cursor"] = cursor_token
+    
+    return contracts
 
 
 @router.get("/{contract_id}", response_model=Dict[str, Any])
@@ -1,12 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, Path, status, Response
+import logging
+from fastapi import APIRouter, Depends, HTTPException, Query, Path, Response, status
+from fastapi.responses import StreamingResponse
 from typing import List, Dict, Any, Optional
-from sqlalchemy.orm import Session
 
 from app.schemas.outreach import OutreachCreate, OutreachUpdate, SendEmail, OutreachDashboard, InitiateCallRequest, InitiateCallResponse, CallAnalysisResponse, SyncConversationsRequest, SyncConversationsResponse, SimpleOutreachCreate
 from app.services.outreach_service import OutreachService
-from app.services.elevenlabs_service import ElevenLabsService
-from app.services.supabase_service import SupabaseService
-from app.core import deps
+from app.services.elevenlabs_service import ElevenLabsService, get_elevenlabs_service
+from app.services.supabase_service import SupabaseService, next_cursor, valid_cursor
+from app.services.loaders import CreatorLoader, get_creator_loader
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
@@ -27,33 +30,42 @@ async def create_outreach_log(
 
 @router.get("/", response_model=List[Dict[str, Any]])
 async def get_outreach_logs(
+    response: Response,
     skip: int = 0,
     limit: int = 100,
     campaign_id: str = None,
     creator_id: str = None,
+    cursor: Optional[str] = Depends(valid_cursor),
     outreach_service: OutreachService = Depends()
 ):
     """
-    Get all outreach logs with optional filtering.
+    Get all outreach logs with optional filtering, newest first.
+    Pass the X-Next-Cursor header of a page back as cursor to fetch the next one.
     """
-    return await outreach_service.get_outreach_logs(
-        skip=skip, 
+    logs = await outreach_service.list_logs(
+        skip=skip,
         limit=limit,
         campaign_id=campaign_id,
-        creator_id=creator_id
+        creator_id=creator_id,
+        cursor=cursor
     )
+    
+    if cursor_token := next_cursor(logs, limit):
+        response.headers["X-Next-Cursor"] = cursor_token
+    
+    return logs
 
 
 @router.get("/dashboard", response_model=Dict[str, Any])
 async def get_outreach_dashboard(
-    db: Session = Depends(deps.get_db),
     campaign_filter: str = None,
-    outreach_service: OutreachService = Depends()
+    outreach_service: OutreachService = Depends(),
+    creator_loader: CreatorLoader = Depends(get_creator_loader)
 ):
     """
     Get outreach management dashboard with summary statistics.
     """
-    return await outreach_service.get_outreach_dashboard(db, campaign_filter)
+    return await outreach_service.get_outreach_dashboard(campaign_filter, creator_loader)
 
 
 @router.get("/{log_id}", response_model=Dict[str, Any])
@@ -105,7 +117,7 @@ async def get_outreach_by_campaign(
     """
     Get all outreach logs for a campaign
     """
-    return await OutreachService.get_outreach_history_by_campaign(campaign_id)
+    return await OutreachService.list_logs(campaign_id=campaign_id, limit=1000)
 
 
 @router.get("/creator/{creator_id}", response_model=List[Dict[str, Any]])
@@ -115,14 +127,14 @@ async def get_outreach_by_creator(
     """
     Get all outreach logs for a creator
     """
-    return await OutreachService.get_outreach_history_by_creator(creator_id)
+    return await OutreachService.list_logs(creator_id=creator_id, limit=1000)
 
 
 # ElevenLabs integration endpoints
 @router.post("/call/initiate", response_model=InitiateCallResponse)
 async def initiate_influencer_call(
     request: InitiateCallRequest,
-    elevenlabs_service: ElevenLabsService = Depends(),
+    elevenlabs_service: ElevenLabsService = Depends(get_elevenlabs_service),
     outreach_service: OutreachService = Depends()
 ):
     """Initiate outbound call to influencer via ElevenLabs + Twilio"""
@@ -185,7 +197,7 @@ async def initiate_influencer_call(
 @router.get("/call/{conversation_id}/analysis", response_model=CallAnalysisResponse)
 async def get_call_analysis(
     conversation_id: str,
-    elevenlabs_service: ElevenLabsService = Depends()
+    elevenlabs_service: ElevenLabsService = Depends(get_elevenlabs_service)
 ):
     """Get detailed call analysis from ElevenLabs"""
     
@@ -227,7 +239,7 @@ async def get_call_analysis(
 @router.post("/sync-conversations", response_model=SyncConversationsResponse)
 async def sync_elevenlabs_conversations(
     request: SyncConversationsRequest = None,
-    elevenlabs_service: ElevenLabsService = Depends(),
+    elevenlabs_service: ElevenLabsService = Depends(get_elevenlabs_service),
     supabase_service: SupabaseService = Depends()
 ):
     """Sync recent conversations from ElevenLabs and update outreach logs"""
@@ -252,10 +264,11 @@ async def sync_elevenlabs_conversations(
             "conversation_ids": [c.get("conversation_id") for c in conversations if c.get("call_successful") == "success" and c.get("status") == "done"]
         }
         
-        print(f"DEBUG - Sync conversations: {debug_info}")
+        logger.debug("Sync conversations: %s", debug_info)
         
         updated_count = 0
         skipped_count = 0
+        tracked_ids = []
         for conversation in conversations:
             conversation_id = conversation.get("conversation_id")
             
@@ -270,24 +283,37 @@ async def sync_elevenlabs_conversations(
             # Check if this conversation is already in the database
             existing_record = await SupabaseService.get_outreach_by_conversation_id(conversation_id)
             if not existing_record:
-                print(f"DEBUG - No existing outreach record found for conversation_id: {conversation_id}")
+                logger.debug("No outreach record found for conversation %s", conversation_id)
                 skipped_count += 1
                 continue
             
-            # Get detailed analysis
-            analysis = await elevenlabs_service.get_conversation_analysis(conversation_id)
+            tracked_ids.append(conversation_id)
+        
+        # Get detailed analyses concurrently
+        analyses = await elevenlabs_service.get_many_analyses(tracked_ids)
+        
+        for conversation_id in tracked_ids:
+            analysis = analyses.get(conversation_id)
+            if analysis is None:
+                logger.warning("No analysis fetched for conversation %s", conversation_id)
+                skipped_count += 1
+                continue
             
             # Update outreach log with analysis results
-            updated = await SupabaseService.update_outreach_from_elevenlabs_analysis(
-                conversation_id=conversation_id,
-                analysis=analysis
-            )
+            try:
+                updated = await SupabaseService.update_outreach_from_elevenlabs_analysis(
+                    conversation_id=conversation_id,
+                    analysis=analysis
+                )
+            except Exception as e:
+                logger.warning("Error updating outreach for conversation %s: %s", conversation_id, e)
+                updated = None
             
             if updated:
                 updated_count += 1
-                print(f"DEBUG - Successfully updated conversation_id: {conversation_id}")
+                logger.debug("Updated outreach for conversation %s", conversation_id)
             else:
-                print(f"DEBUG - Failed to update conversation_id: {conversation_id}")
+                logger.warning("Failed to update outreach for conversation %s", conversation_id)
                 skipped_count += 1
         
         return {
@@ -300,7 +326,7 @@ async def sync_elevenlabs_conversations(
         }
         
     except Exception as e:
-        print(f"DEBUG - Error in sync_elevenlabs_conversations: {str(e)}")
+        logger.error("Error syncing ElevenLabs conversations: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to sync conversations: {str(e)}"
@@ -308,7 +334,7 @@ async def sync_elevenlabs_conversations(
 
 @router.get("/debug/conversations", response_model=Dict[str, Any])
 async def debug_get_conversations(
-    elevenlabs_service: ElevenLabsService = Depends()
+    elevenlabs_service: ElevenLabsService = Depends(get_elevenlabs_service)
 ):
     """Debug endpoint to get raw conversation data from ElevenLabs"""
     try:
@@ -328,7 +354,7 @@ async def debug_get_conversations(
 @router.get("/debug/conversation/{conversation_id}", response_model=Dict[str, Any])
 async def debug_get_conversation(
     conversation_id: str,
-    elevenlabs_service: ElevenLabsService = Depends()
+    elevenlabs_service: ElevenLabsService = Depends(get_elevenlabs_service)
 ):
     """Debug endpoint to get a specific conversation's details"""
     try:
@@ -350,23 +376,39 @@ async def debug_get_conversation(
 @router.get("/call/{conversation_id}/audio")
 async def get_call_audio(
     conversation_id: str,
-    elevenlabs_service: ElevenLabsService = Depends()
+    elevenlabs_service: ElevenLabsService = Depends(get_elevenlabs_service)
 ):
     """Get audio recording of a call from ElevenLabs"""
     
+    audio_stream = elevenlabs_service.stream_conversation_audio(conversation_id)
+    
     try:
-        audio_content = await elevenlabs_service.get_conversation_audio(conversation_id)
-        
-        return Response(
-            content=audio_content,
-            media_type="audio/mp3",
-            headers={
-                "Content-Disposition": f"attachment; filename={conversation_id}.mp3"
-            }
-        )
-        
+        # Pull the first chunk here so upstream errors still surface as a 500
+        # before the streaming response has started
+        first_chunk = await audio_stream.__anext__()
+    except StopAsyncIteration:
+        first_chunk = b""
     except Exception as e:
+        await audio_stream.aclose()
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get call audio: {str(e)}"
-        ) 
\ No newline at end of file
+        )
+    
+    async def audio_chunks():
+        # Close the upstream stream however this ends (done, failed or client
+        # disconnected), so its pooled connection is released
+        try:
+            yield first_chunk
+            async for chunk in audio_stream:
+                yield chunk
+        finally:
+            await audio_stream.aclose()
+    
+    return StreamingResponse(
+        audio_chunks(),
+        media_type="audio/mp3",
+        headers={
+            "Content-Disposition": f"attachment; filename={conversation_id}.mp3"
+        }
+    ) 
\ No newline at end of file
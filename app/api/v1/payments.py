@@ -1,8 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, Path
+from fastapi import APIRouter, Depends, HTTPException, Query, Path, Response
 from typing import List, Dict, Any, Optional
 
 from app.schemas.payment import PaymentCreate, PaymentUpdate, PaymentProcess
 from app.services.payment_service import PaymentService
+from app.services.supabase_service import next_cursor, valid_cursor
 
 router = APIRouter()
 
@@ -19,20 +20,29 @@ async def create_payment(
 
 @router.get("/", response_model=List[Dict[str, Any]])
 async def get_payments(
+    response: Response,
     contract_id: Optional[str] = None,
     status: Optional[str] = None,
     limit: int = Query(20, ge=1, le=100),
-    offset: int = Query(0, ge=0)
+    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Depends(valid_cursor)
 ):
     """
-    List all payments
+    List all payments, newest first
+    Pass the X-Next-Cursor header of a page back as cursor to fetch the next one
     """
-    return await PaymentService.get_payments(
+    payments = await PaymentService.get_payments(
         skip=offset, 
         limit=limit, 
         contract_id=contract_id, 
-        status=status
+        status=status,
+        cursor=cursor
     )
+    
+    if cursor_token := next_cursor(payments, limit):
+        response.headers["X-Next-Cursor"] = cursor_token
+    
+    return payments
 
 
 @router.get("/{payment_id}", response_model=Dict[str, Any])
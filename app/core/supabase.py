@@ -1,4 +1,7 @@
 import os
+import httpx
+import orjson
+from postgrest.utils import SyncClient
 from supabase import create_client, Client
 from dotenv import load_dotenv
 import logging
@@ -16,6 +19,41 @@ supabase_key = os.getenv("SUPABASE_KEY")
 # Initialize Supabase client
 supabase: Client = create_client(supabase_url, supabase_key)
 
+
+def _decode_with_orjson(response: httpx.Response) -> None:
+    """
+    Response hook so PostgREST bodies are decoded with orjson rather than stdlib json.
+    The body is read lazily when postgrest calls response.json(), after the hook runs.
+    """
+    response.json = lambda **kwargs: orjson.loads(response.content)
+
+
+class _OrjsonClient(SyncClient):
+    """PostgREST session that encodes JSON request bodies with orjson rather than stdlib json"""
+    
+    def build_request(self, method, url, *, json=None, **kwargs) -> httpx.Request:
+        if json is not None:
+            kwargs["content"] = orjson.dumps(json)
+            headers = httpx.Headers(kwargs.get("headers"))
+            headers.setdefault("Content-Type", "application/json")
+            kwargs["headers"] = headers
+        return super().build_request(method, url, **kwargs)
+
+
+# Swap the default PostgREST session for one with an explicit keep-alive pool,
+# shared by every SupabaseService call so connections and TLS sessions are reused
+_default_session = supabase.postgrest.session
+supabase.postgrest.session = _OrjsonClient(
+    base_url=_default_session.base_url,
+    headers=_default_session.headers,
+    http2=True,
+    follow_redirects=True,
+    limits=httpx.Limits(max_keepalive_connections=80, max_connections=120, keepalive_expiry=30.0),
+    timeout=httpx.Timeout(10.0, connect=2.0),
+    event_hooks={"response": [_decode_with_orjson]}
+)
+_default_session.close()
+
 # Add custom methods to the Supabase client
 def execute_sql(sql_query):
     """
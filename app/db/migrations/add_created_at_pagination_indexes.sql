@@ -0,0 +1,11 @@
+-- Add indexes matching the newest-first keyset pagination order of the remaining list endpoints
+-- CREATE INDEX CONCURRENTLY cannot run inside a transaction, so run these statements individually
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS creators_created_at_id_idx
+  ON creators (created_at DESC, id DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS campaigns_created_at_id_idx
+  ON campaigns (created_at DESC, id DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS contracts_created_at_id_idx
+  ON contracts (created_at DESC, id DESC);
@@ -0,0 +1,9 @@
+-- Replace the IVFFlat index on creators.embedding_vector with an HNSW index
+-- This changes recall and latency for match_creators and match_creators_batch alike: HNSW needs no
+-- training lists and keeps recall stable as the table grows, but takes longer to build
+-- CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction, so run these statements individually
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS creators_embedding_vector_hnsw_idx
+  ON creators USING hnsw (embedding_vector vector_cosine_ops);
+
+DROP INDEX CONCURRENTLY IF EXISTS creators_embedding_vector_idx;
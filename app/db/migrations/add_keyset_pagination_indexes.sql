@@ -0,0 +1,8 @@
+-- Add indexes matching the newest-first keyset pagination order of the list endpoints
+-- CREATE INDEX CONCURRENTLY cannot run inside a transaction, so run these statements individually
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS outreach_logs_created_at_id_idx
+  ON outreach_logs (created_at DESC, id DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS payments_created_at_id_idx
+  ON payments (created_at DESC, id DESC);
@@ -0,0 +1,17 @@
+-- Add indexes for the filtered outreach and payment listings
+-- Lets WHERE campaign_id / creator_id ... ORDER BY created_at DESC LIMIT n use an index scan
+-- CREATE INDEX CONCURRENTLY cannot run inside a transaction, so run these statements individually
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS outreach_logs_campaign_created_at_idx
+  ON outreach_logs (campaign_id, created_at DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS outreach_logs_creator_created_at_idx
+  ON outreach_logs (creator_id, created_at DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS payments_contract_idx
+  ON payments (contract_id);
+
+-- Partial index, only the statuses the API filters and summarizes on
+CREATE INDEX CONCURRENTLY IF NOT EXISTS payments_status_idx
+  ON payments (status)
+  WHERE status IN ('pending', 'completed');
@@ -0,0 +1,23 @@
+-- Create a function returning creator embeddings as packed float4 bytes
+-- This lets clients load embeddings into an array without parsing JSON float lists
+
+CREATE OR REPLACE FUNCTION get_creator_embeddings_binary (
+  p_limit INT,
+  p_offset INT
+)
+RETURNS TABLE (
+  id UUID,
+  emb TEXT
+)
+LANGUAGE SQL STABLE
+AS $$
+  -- vector_send is a 2-byte dimension, 2 unused bytes, then big-endian float4 values
+  SELECT
+    creators.id::UUID,
+    encode(substring(vector_send(creators.embedding_vector) FROM 5), 'base64') AS emb
+  FROM creators
+  WHERE creators.embedding_vector IS NOT NULL
+  ORDER BY creators.id
+  LIMIT p_limit
+  OFFSET p_offset;
+$$;
@@ -0,0 +1,14 @@
+-- Create a function returning the planner's row estimate for a table
+-- This is a cheap alternative to COUNT(*) for UIs that only need an approximate total
+
+CREATE OR REPLACE FUNCTION estimate_rows (
+  table_name TEXT
+)
+RETURNS BIGINT
+LANGUAGE SQL STABLE
+AS $$
+  -- reltuples is -1 for tables that have never been analyzed
+  SELECT GREATEST(reltuples, 0)::BIGINT
+  FROM pg_class
+  WHERE oid = to_regclass(table_name);
+$$;
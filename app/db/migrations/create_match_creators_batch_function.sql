@@ -0,0 +1,41 @@
+-- Create a function to match creators against several query embeddings in one call
+-- Each embedding is passed as pgvector text ('[0.1,0.2,...]') and results are tagged with
+-- the 0-based position of the query they belong to
+
+CREATE OR REPLACE FUNCTION match_creators_batch (
+  query_embeddings TEXT[],
+  match_threshold FLOAT,
+  match_count INT
+)
+RETURNS TABLE (
+  query_idx INT,
+  id UUID,
+  name TEXT,
+  platform TEXT,
+  followers_count TEXT,
+  engagement_rate FLOAT,
+  niche TEXT,
+  similarity FLOAT
+)
+LANGUAGE SQL STABLE
+AS $$
+  SELECT
+    (q.ordinality - 1)::INT AS query_idx,
+    m.*
+  FROM unnest(query_embeddings) WITH ORDINALITY AS q(embedding, ordinality)
+  CROSS JOIN LATERAL (
+    SELECT
+      creators.id::UUID,
+      creators.name,
+      creators.platform,
+      creators.followers_count,
+      creators.engagement_rate,
+      creators.niche,
+      1 - (creators.embedding_vector <=> q.embedding::VECTOR(1536)) AS similarity
+    FROM creators
+    WHERE 1 - (creators.embedding_vector <=> q.embedding::VECTOR(1536)) > match_threshold
+      AND creators.embedding_vector IS NOT NULL
+    ORDER BY creators.embedding_vector <=> q.embedding::VECTOR(1536)
+    LIMIT match_count
+  ) AS m;
+$$;
@@ -0,0 +1,24 @@
+-- Create a materialized view with per-campaign outreach dashboard counts
+-- The dashboard reads these pre-aggregated rows instead of tallying raw logs per request
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS outreach_dashboard_summary AS
+  SELECT
+    -- Logs without a campaign are grouped under the nil UUID, so the unique key
+    -- below matches the grouping and still covers every row
+    COALESCE(campaign_id, '00000000-0000-0000-0000-000000000000'::uuid) AS campaign_key,
+    NULLIF(
+      COALESCE(campaign_id, '00000000-0000-0000-0000-000000000000'::uuid),
+      '00000000-0000-0000-0000-000000000000'::uuid
+    ) AS campaign_id,
+    COUNT(*) AS total_contacts,
+    COUNT(*) FILTER (WHERE channel = 'call' AND status = 'completed') AS calls_completed,
+    COUNT(*) FILTER (WHERE channel = 'email' AND message_type = 'reply') AS email_replies,
+    COUNT(*) FILTER (
+      WHERE channel = 'call' AND COALESCE(content->>'recording_url', '') <> ''
+    ) AS recordings
+  FROM outreach_logs
+  GROUP BY COALESCE(campaign_id, '00000000-0000-0000-0000-000000000000'::uuid);
+
+-- A unique index on plain columns is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE UNIQUE INDEX IF NOT EXISTS outreach_dashboard_summary_campaign_idx
+  ON outreach_dashboard_summary (campaign_key);
@@ -0,0 +1,21 @@
+-- Create a function to compute payment summary statistics in the database
+-- This returns a single row instead of shipping every payment to the API
+
+CREATE OR REPLACE FUNCTION payment_summary ()
+RETURNS TABLE (
+  total_payments BIGINT,
+  total_amount NUMERIC,
+  pending_payments BIGINT,
+  completed_payments BIGINT,
+  average_payment NUMERIC
+)
+LANGUAGE SQL STABLE
+AS $$
+  SELECT
+    COUNT(*),
+    COALESCE(SUM(amount), 0),
+    COUNT(*) FILTER (WHERE status = 'pending'),
+    COUNT(*) FILTER (WHERE status = 'completed'),
+    COALESCE(AVG(amount), 0)
+  FROM payments;
+$$;
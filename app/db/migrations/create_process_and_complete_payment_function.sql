@@ -0,0 +1,20 @@
+-- Create a function to process and complete a payment in a single call
+-- This replaces the separate process + status update round trips from the API
+
+CREATE OR REPLACE FUNCTION process_and_complete_payment (
+  p_payment_id UUID,
+  p_payment_method TEXT
+)
+RETURNS SETOF payments
+LANGUAGE SQL VOLATILE
+AS $$
+  UPDATE payments
+  SET
+    payment_method = p_payment_method,
+    transaction_id = 'txn_mock_' || substr(md5(random()::TEXT), 1, 8),
+    status = 'completed',
+    paid_at = NOW(),
+    updated_at = NOW()
+  WHERE id = p_payment_id
+  RETURNING *;
+$$;
@@ -0,0 +1,14 @@
+-- Create a function to insert an outreach log with default values and return its ID
+-- This lets the database generate the ID and fill in the defaults in a single call
+
+CREATE OR REPLACE FUNCTION create_simple_outreach (
+  p_campaign UUID,
+  p_creator UUID
+)
+RETURNS TEXT
+LANGUAGE SQL VOLATILE
+AS $$
+  INSERT INTO outreach_logs (id, campaign_id, creator_id, channel, message_type, content, status)
+  VALUES (gen_random_uuid(), p_campaign, p_creator, 'initial', 'outreach', '{}', 'initialized')
+  RETURNING id::TEXT;
+$$;
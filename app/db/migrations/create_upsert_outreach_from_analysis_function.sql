@@ -0,0 +1,58 @@
+-- Create a function to apply an ElevenLabs analysis to the outreach log of a conversation
+-- Looks up the row by conversation_id and updates it in one statement; keys missing from
+-- p_update keep their current values
+
+CREATE OR REPLACE FUNCTION upsert_outreach_from_analysis (
+  p_conversation_id TEXT,
+  p_update JSONB
+)
+RETURNS SETOF outreach_logs
+LANGUAGE SQL VOLATILE
+AS $$
+  UPDATE outreach_logs AS o
+  SET (
+    status,
+    call_duration_seconds,
+    call_successful,
+    transcript_summary,
+    full_transcript,
+    interest_assessment_result,
+    interest_assessment_rationale,
+    communication_quality_result,
+    communication_quality_rationale,
+    interest_level,
+    collaboration_rate,
+    preferred_content_types,
+    timeline_availability,
+    contact_preferences,
+    audience_demographics,
+    brand_restrictions,
+    follow_up_actions,
+    sentiment,
+    updated_at
+  ) = (
+    SELECT
+      r.status,
+      r.call_duration_seconds,
+      r.call_successful,
+      r.transcript_summary,
+      r.full_transcript,
+      r.interest_assessment_result,
+      r.interest_assessment_rationale,
+      r.communication_quality_result,
+      r.communication_quality_rationale,
+      r.interest_level,
+      r.collaboration_rate,
+      r.preferred_content_types,
+      r.timeline_availability,
+      r.contact_preferences,
+      r.audience_demographics,
+      r.brand_restrictions,
+      r.follow_up_actions,
+      r.sentiment,
+      NOW()
+    FROM jsonb_populate_record(o, p_update) AS r
+  )
+  WHERE o.conversation_id = p_conversation_id
+  RETURNING o.*;
+$$;
@@ -0,0 +1,51 @@
+-- Create a function to apply a raw ElevenLabs conversation analysis to its outreach log
+-- Fields are extracted from the analysis JSON here and written through upsert_outreach_from_analysis
+
+CREATE OR REPLACE FUNCTION upsert_outreach_from_raw_analysis (
+  p_conversation_id TEXT,
+  p_analysis JSONB
+)
+RETURNS SETOF outreach_logs
+LANGUAGE SQL VOLATILE
+AS $$
+  SELECT *
+  FROM upsert_outreach_from_analysis(
+    p_conversation_id,
+    (
+      -- Only fields present in the analysis are written; the rest keep their values
+      SELECT jsonb_object_agg(f.column_name, f.value)
+      FROM (
+        VALUES
+          ('status', to_jsonb(
+            CASE p_analysis->>'status' WHEN 'done' THEN 'completed' ELSE p_analysis->>'status' END
+          )),
+          ('call_duration_seconds', p_analysis #> '{metadata,duration_seconds}'),
+          ('call_successful', p_analysis #> '{analysis,call_successful}'),
+          ('transcript_summary', p_analysis #> '{analysis,transcript_summary}'),
+          ('full_transcript', p_analysis -> 'transcript'),
+          ('interest_assessment_result', p_analysis #> '{analysis,evaluation_criteria_results,collaboration_interest_assessment,result}'),
+          ('interest_assessment_rationale', p_analysis #> '{analysis,evaluation_criteria_results,collaboration_interest_assessment,rationale}'),
+          ('communication_quality_result', p_analysis #> '{analysis,evaluation_criteria_results,professional_communication_quality,result}'),
+          ('communication_quality_rationale', p_analysis #> '{analysis,evaluation_criteria_results,professional_communication_quality,rationale}'),
+          ('interest_level', p_analysis #> '{analysis,data_collection_results,interest_level,value}'),
+          ('collaboration_rate', p_analysis #> '{analysis,data_collection_results,collaboration_rate,value}'),
+          ('preferred_content_types', p_analysis #> '{analysis,data_collection_results,preferred_content_types,value}'),
+          ('timeline_availability', p_analysis #> '{analysis,data_collection_results,timeline_availability,value}'),
+          ('contact_preferences', p_analysis #> '{analysis,data_collection_results,contact_preferences,value}'),
+          ('audience_demographics', p_analysis #> '{analysis,data_collection_results,audience_demographics,value}'),
+          ('brand_restrictions', p_analysis #> '{analysis,data_collection_results,brand_restrictions,value}'),
+          ('follow_up_actions', p_analysis #> '{analysis,data_collection_results,follow_up_actions,value}'),
+          ('sentiment', to_jsonb(
+            CASE
+              WHEN p_analysis #> '{analysis,data_collection_results,interest_level}' IS NULL THEN NULL
+              WHEN p_analysis #>> '{analysis,data_collection_results,interest_level,value}' = 'very_interested' THEN 'positive'
+              WHEN p_analysis #>> '{analysis,data_collection_results,interest_level,value}' = 'interested' THEN 'neutral_positive'
+              WHEN p_analysis #>> '{analysis,data_collection_results,interest_level,value}' = 'neutral' THEN 'neutral'
+              ELSE 'neutral_negative'
+            END
+          ))
+      ) AS f(column_name, value)
+      WHERE f.value IS NOT NULL
+    )
+  );
+$$;
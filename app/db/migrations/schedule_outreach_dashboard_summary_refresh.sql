@@ -0,0 +1,9 @@
+-- Schedule a refresh of the outreach_dashboard_summary view every 5 minutes, without blocking readers
+-- Requires the pg_cron extension: on Supabase, enable it under Database > Extensions first
+-- (CREATE EXTENSION needs superuser), then run this after create_outreach_dashboard_summary_view.sql
+
+SELECT cron.schedule(
+  'refresh_outreach_dashboard_summary',
+  '*/5 * * * *',
+  'REFRESH MATERIALIZED VIEW CONCURRENTLY outreach_dashboard_summary'
+);
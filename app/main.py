@@ -1,14 +1,17 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.core.config import settings
 from app.api.router import api_router
+from app.services.elevenlabs_service import elevenlabs_service
 
 # Create FastAPI app
 app = FastAPI(
     title="InfluencerFlow AI Platform API",
     description="Backend API for InfluencerFlow AI Platform",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
@@ -44,3 +47,4 @@ async def startup_event():
 async def shutdown_event():
     # Close connections, clean up resources
     print("Shutting down InfluencerFlow API...")
+    await elevenlabs_service.aclose()
@@ -1,7 +1,7 @@
 import logging
 from typing import List, Dict, Any, Optional
 import openai
-from openai import OpenAI
+from openai import AsyncOpenAI
 from app.core.config import settings
 from app.models.creator import Creator
 from app.models.campaign import Campaign
@@ -12,6 +12,9 @@ from app.schemas.ai_matching import AISimilaritySearchRequest
 
 logger = logging.getLogger(__name__)
 
+# Creator columns read when formatting similarity matches (skips the embedding)
+_MATCH_DETAIL_COLS = "id,name,platform,channel_name,followers_count,engagement_rate,collaboration_rate"
+
 
 class AIService:
     """
@@ -26,7 +29,7 @@ class AIService:
             self.client = None
         else:
             self.use_mock = False
-            self.client = OpenAI(api_key=self.api_key)
+            self.client = AsyncOpenAI(api_key=self.api_key)
     
     async def search_creators(self, query: str, budget_range: Optional[List[float]] = None, 
                              target_audience: Optional[str] = None) -> Dict[str, Any]:
@@ -51,7 +54,7 @@ class AIService:
                 user_message += f"Target Audience: {target_audience}\n"
             
             # Call OpenAI API with new client pattern
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model="gpt-4",
                 messages=[
                     {"role": "system", "content": system_message},
@@ -125,7 +128,7 @@ class AIService:
             - Niche: {creator.get('niche', 'Unknown')}
             """
             
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model="gpt-4",
                 messages=[
                     {"role": "system", "content": system_message},
@@ -185,6 +188,9 @@ class AIService:
                 logger.warning("No matching creators found")
                 return await self._get_placeholder_similarity_results(request_data)
             
+            # Fetch creator details for all matches in one query
+            details_by_id = await self._get_creator_details(matched_creators)
+            
             # Format results into the expected response format
             matches = []
             for creator in matched_creators:
@@ -202,10 +208,8 @@ class AIService:
                 engagement_score_str = f"{engagement_score:.2f}%"
                 budget_fit_str = f"{budget_fit:.2f}%"
                 
-                # Get additional creator details if needed
-                creator_details = await SupabaseService.get_creator(creator.get('id'))
-                if not creator_details:
-                    creator_details = creator
+                # Use additional creator details if available
+                creator_details = details_by_id.get(creator.get('id')) or creator
                     
                 # Format creator name with handle
                 name = creator_details.get('name', creator.get('name', 'Unknown'))
@@ -253,7 +257,7 @@ class AIService:
                 # Return a random vector of appropriate dimension
                 return [0.01] * 1536
                 
-            response = self.client.embeddings.create(
+            response = await self.client.embeddings.create(
                 model="text-embedding-ada-002",
                 input=text
             )
@@ -302,6 +306,12 @@ class AIService:
             logger.error(f"Error generating creator embedding: {str(e)}")
             return False
     
+    async def _get_creator_details(self, creators: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Fetch the creator columns used by match results in one query, keyed by ID"""
+        creator_ids = list({creator.get('id') for creator in creators if creator.get('id')})
+        rows = await SupabaseService.get_creators_by_ids(creator_ids, fields=_MATCH_DETAIL_COLS)
+        return {row['id']: row for row in rows}
+    
     def _calculate_cosine_similarity(self, vec1: List[float], vec2: List[float]) -> float:
         """Calculate cosine similarity between two vectors"""
         if not vec1 or not vec2:
@@ -517,6 +527,9 @@ class AIService:
                 logger.warning("No matching creators found")
                 return await self._get_placeholder_similarity_results_for_campaign(campaign_id)
             
+            # Fetch creator details for all matches in one query
+            details_by_id = await self._get_creator_details(matched_creators)
+            
             # Format results into the expected response format
             matches = []
             for creator in matched_creators:
@@ -534,10 +547,8 @@ class AIService:
                 engagement_score_str = f"{engagement_score:.2f}%"
                 budget_fit_str = f"{budget_fit:.2f}%"
                 
-                # Get additional creator details if needed
-                creator_details = await SupabaseService.get_creator(creator.get('id'))
-                if not creator_details:
-                    creator_details = creator
+                # Use additional creator details if available
+                creator_details = details_by_id.get(creator.get('id')) or creator
                     
                 # Format creator name with handle
                 name = creator_details.get('name', creator.get('name', 'Unknown'))
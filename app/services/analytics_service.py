@@ -1,19 +1,22 @@
 import logging
 from typing import List, Dict, Any, Optional
-from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
-import random
+import numpy as np
 from app.services.supabase_service import SupabaseService
 
 logger = logging.getLogger(__name__)
 
+# Shared generator for placeholder metrics; draws are batched per call
+_rng = np.random.default_rng()
+
 
 class AnalyticsService:
     """
     Service for analytics and reporting
     """
     
-    async def get_campaign_analytics(self, db: Session, campaign_id: str) -> Dict[str, Any]:
+    @staticmethod
+    async def get_campaign_analytics(campaign_id: str) -> Dict[str, Any]:
         """
         Get analytics for a specific campaign
         """
@@ -28,23 +31,28 @@ class AnalyticsService:
             # For now, generate placeholder analytics data
             
             # Generate placeholder performance data
-            total_reach = random.randint(300000, 600000)
-            total_engagement = int(total_reach * random.uniform(0.05, 0.08))
-            total_views = int(total_reach * random.uniform(0.7, 0.9))
+            total_reach = int(_rng.integers(300000, 600000, endpoint=True))
+            engagement_ratio, views_ratio, roi = _rng.uniform([0.05, 0.7, 2.5], [0.08, 0.9, 4.0]).tolist()
+            total_engagement = int(total_reach * engagement_ratio)
+            total_views = int(total_reach * views_ratio)
             avg_engagement_rate = round(total_engagement / total_reach * 100, 1)
-            roi = round(random.uniform(2.5, 4.0), 1)
+            roi = round(roi, 1)
             
             # Get creators associated with this campaign via contracts
             contracts = await SupabaseService.get_contracts(campaign_id=campaign_id, limit=10)
             
             # Generate placeholder creator performance data
             creator_performance = []
-            for i, contract in enumerate(contracts[:3]):  # Limit to 3 creators for placeholder
-                creator_id = contract.get("creator_id")
-                creator = await SupabaseService.get_creator(creator_id)
+            view_ratios = _rng.uniform(0.2, 0.4, 3).tolist()
+            contracts = contracts[:3]  # Limit to 3 creators for placeholder
+            creator_ids = list({c["creator_id"] for c in contracts if c.get("creator_id")})
+            creators = await SupabaseService.get_creators_by_ids(creator_ids)
+            creators_by_id = {c["id"]: c for c in creators}
+            for i, contract in enumerate(contracts):
+                creator = creators_by_id.get(contract.get("creator_id"))
                 
                 if creator:
-                    content_views = int(creator.get("followers_count_numeric", 10000) * random.uniform(0.2, 0.4))
+                    content_views = int(creator.get("followers_count_numeric", 10000) * view_ratios[i])
                     engagement = int(content_views * (creator.get("engagement_rate", 5.0) / 100))
                     creator_performance.append({
                         "creator_id": creator["id"],
@@ -58,11 +66,13 @@ class AnalyticsService:
             # Generate placeholder timeline data (last 7 days)
             timeline = []
             base_date = datetime.utcnow() - timedelta(days=7)
+            daily_view_factors = _rng.uniform(0.8, 1.2, 7).tolist()
+            daily_engagement_ratios = _rng.uniform(0.05, 0.08, 7).tolist()
             for i in range(7):
                 date = base_date + timedelta(days=i)
                 date_str = date.strftime("%Y-%m-%d")
-                daily_views = int(total_views / 7 * random.uniform(0.8, 1.2))
-                daily_engagement = int(daily_views * random.uniform(0.05, 0.08))
+                daily_views = int(total_views / 7 * daily_view_factors[i])
+                daily_engagement = int(daily_views * daily_engagement_ratios[i])
                 timeline.append({
                     "date": date_str,
                     "views": daily_views,
@@ -86,50 +96,55 @@ class AnalyticsService:
             logger.error(f"Error fetching campaign analytics: {str(e)}")
             return None
     
-    async def get_analytics_dashboard(self, db: Session) -> Dict[str, Any]:
+    @staticmethod
+    async def get_analytics_dashboard() -> Dict[str, Any]:
         """
         Get overall platform analytics dashboard
         """
         try:
-            # Get actual data from Supabase
-            campaigns = await SupabaseService.get_campaigns(limit=1000)
-            creators = await SupabaseService.get_creators(limit=1000)
-            contracts = await SupabaseService.get_contracts(limit=1000)
+            # Get actual data from Supabase, selecting only the columns used below
+            campaigns = await SupabaseService.get_campaigns(limit=1000, fields="status,total_budget")
+            creators = await SupabaseService.get_creators(limit=1000, fields="id")
+            contracts = await SupabaseService.get_contracts(limit=1000, fields="id")
             
             # Generate overview data
             total_campaigns = len(campaigns)
-            active_campaigns = len([c for c in campaigns if c.get("status") == "active"])
             total_creators = len(creators)
             total_contracts = len(contracts)
-            total_budget = sum(c.get("total_budget", 0) for c in campaigns)
+            active_campaigns = 0
+            total_budget = 0
+            for c in campaigns:
+                active_campaigns += c.get("status") == "active"
+                total_budget += c.get("total_budget") or 0
             
             # Generate placeholder performance metrics
-            avg_campaign_roi = round(random.uniform(2.5, 3.5), 1)
-            avg_engagement_rate = round(random.uniform(4.8, 5.5), 1)
-            creator_satisfaction = round(random.uniform(4.3, 4.8), 1)
-            contract_completion_rate = round(random.uniform(85, 95), 1)
+            avg_campaign_roi, avg_engagement_rate, creator_satisfaction, contract_completion_rate = (
+                round(value, 1)
+                for value in _rng.uniform([2.5, 4.8, 4.3, 85], [3.5, 5.5, 4.8, 95]).tolist()
+            )
             
-            # Generate placeholder recent activity
+            # Generate placeholder recent activity (datetimes are serialized by the response class)
+            now = datetime.utcnow()
             recent_activity = [
                 {
                     "type": "contract_signed",
                     "description": "Contract signed with creator for campaign",
-                    "timestamp": (datetime.utcnow() - timedelta(hours=3)).isoformat()
+                    "timestamp": now - timedelta(hours=3)
                 },
                 {
                     "type": "campaign_completed",
                     "description": "Campaign marked as completed",
-                    "timestamp": (datetime.utcnow() - timedelta(days=1)).isoformat()
+                    "timestamp": now - timedelta(days=1)
                 },
                 {
                     "type": "payment_processed",
                     "description": "Payment processed for creator",
-                    "timestamp": (datetime.utcnow() - timedelta(days=2)).isoformat()
+                    "timestamp": now - timedelta(days=2)
                 },
                 {
                     "type": "creator_added",
                     "description": "New creator added to the platform",
-                    "timestamp": (datetime.utcnow() - timedelta(days=3)).isoformat()
+                    "timestamp": now - timedelta(days=3)
                 }
             ]
             
@@ -0,0 +1,91 @@
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional
+import msgpack
+from cachetools import TTLCache
+from redis import asyncio as redis_asyncio
+from redis.exceptions import RedisError
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Cache for hot, read-mostly single rows (creators, campaigns, contracts, payments,
+# outreach logs). Entries expire after 30 seconds and are dropped explicitly on writes.
+DEFAULT_TTL = 30
+
+# In-process fallback, used when REDIS_URL is not configured
+_caches: Dict[int, TTLCache] = {DEFAULT_TTL: TTLCache(maxsize=2048, ttl=DEFAULT_TTL)}
+
+
+def _cache_for(ttl: int) -> TTLCache:
+    try:
+        return _caches[ttl]
+    except KeyError:
+        # Other TTLs are only used for a handful of aggregate values
+        cache = _caches[ttl] = TTLCache(maxsize=256, ttl=ttl)
+        return cache
+
+
+class CacheService:
+    """
+    Read-through cache keyed by strings such as ``creator:{id}``
+    With REDIS_URL set, entries are stored msgpack-encoded in Redis so every worker shares
+    them and sees invalidations; otherwise each process keeps its own TTL cache
+    """
+
+    _redis: Optional[redis_asyncio.Redis] = None
+
+    @classmethod
+    def _client(cls) -> Optional[redis_asyncio.Redis]:
+        if cls._redis is None and settings.REDIS_URL:
+            cls._redis = redis_asyncio.from_url(settings.REDIS_URL)
+        return cls._redis
+
+    @classmethod
+    async def get_or_fetch(
+        cls,
+        key: str,
+        ttl: int,
+        fetcher: Callable[[], Awaitable[Optional[Any]]]
+    ) -> Optional[Any]:
+        """
+        Return the cached value for key, calling fetcher on a miss
+        Empty results are not cached, so a missing row is looked up again next time
+        """
+        client = cls._client()
+        if client is None:
+            cache = _cache_for(ttl)
+            try:
+                return cache[key]
+            except KeyError:
+                pass
+            value = await fetcher()
+            if value is not None:
+                cache[key] = value
+            return value
+
+        try:
+            raw = await client.get(key)
+            if raw is not None:
+                return msgpack.unpackb(raw)
+        except RedisError as e:
+            logger.warning("Cache read failed for %s: %s", key, e)
+
+        value = await fetcher()
+        if value is not None:
+            try:
+                await client.set(key, msgpack.packb(value), ex=ttl)
+            except RedisError as e:
+                logger.warning("Cache write failed for %s: %s", key, e)
+        return value
+
+    @classmethod
+    async def invalidate(cls, key: str) -> None:
+        """Drop a cached entry after the underlying row changes"""
+        for cache in _caches.values():
+            cache.pop(key, None)
+        client = cls._client()
+        if client is not None:
+            try:
+                await client.delete(key)
+            except RedisError as e:
+                logger.warning("Cache invalidation failed for %s: %s", key, e)
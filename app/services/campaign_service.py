@@ -1,38 +1,38 @@
 import logging
 from typing import List, Dict, Any, Optional
 from uuid import UUID
-from sqlalchemy.orm import Session
 from datetime import datetime
 import uuid
 from fastapi import HTTPException
 
-from app.models.campaign import Campaign
 from app.schemas.campaign import CampaignCreate, CampaignUpdate
 from app.services.ai_service import AIService
 from app.services.supabase_service import SupabaseService
+from app.utils.ids import next_uuid
 
 logger = logging.getLogger(__name__)
 
+# Shared AI service instance; it holds only the OpenAI client configuration
+_ai_service = AIService()
+
 
 class CampaignService:
     """
     Service for managing campaign-related operations
     """
     
-    def __init__(self):
-        self.ai_service = AIService()
-    
     @staticmethod
     async def get_campaigns(
         skip: int = 0,
         limit: int = 100,
-        status: Optional[str] = None
+        status: Optional[str] = None,
+        cursor: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """
         Get all campaigns with optional filtering
         """
         try:
-            return await SupabaseService.get_campaigns(skip=skip, limit=limit, status=status)
+            return await SupabaseService.get_campaigns(skip=skip, limit=limit, status=status, cursor=cursor)
         except Exception as e:
             logger.error(f"Error getting campaigns: {e}")
             raise HTTPException(status_code=500, detail="Error retrieving campaigns")
@@ -60,8 +60,8 @@ class CampaignService:
         """
         try:
             # Set default values
-            campaign_dict = campaign_data.model_dump()
-            campaign_dict["id"] = str(uuid.uuid4())
+            campaign_dict = campaign_data.model_dump(mode="json", exclude_none=True)
+            campaign_dict["id"] = next_uuid()
             campaign_dict["status"] = "draft"  # Set default status
             campaign_dict["influencer_count"] = 0  # Set default influencer count
             campaign_dict["created_at"] = datetime.utcnow().isoformat()
@@ -141,8 +141,9 @@ class CampaignService:
             logger.error(f"Error getting campaigns for brand {brand_name}: {e}")
             raise HTTPException(status_code=500, detail=f"Error retrieving campaigns for brand {brand_name}")
     
-    async def select_influencer(self, db: Session, campaign_id: str, 
-                             influencer_id: str, notes: Optional[str] = None) -> Dict[str, Any]:
+    @staticmethod
+    async def select_influencer(campaign_id: str, influencer_id: str,
+                                notes: Optional[str] = None) -> Dict[str, Any]:
         """
         Select an influencer for a campaign and move to outreach
         """
@@ -164,14 +165,14 @@ class CampaignService:
             logger.error(f"Error selecting influencer for campaign: {str(e)}")
             return None
     
-    async def ai_match_analysis(self, db: Session, campaign_id: str, 
-                             influencer_id: str) -> Dict[str, Any]:
+    @staticmethod
+    async def ai_match_analysis(campaign_id: str, influencer_id: str) -> Dict[str, Any]:
         """
         Get AI-powered match analysis for campaign and influencer
         """
         try:
             # Call the AI service for match analysis
-            return await self.ai_service.analyze_creator_match(campaign_id, influencer_id)
+            return await _ai_service.analyze_creator_match(campaign_id, influencer_id)
             
         except Exception as e:
             logger.error(f"Error getting AI match analysis: {str(e)}")
@@ -1,15 +1,12 @@
 import logging
 from typing import List, Dict, Any, Optional
 from uuid import UUID
-from sqlalchemy.orm import Session
 from datetime import datetime
 from fastapi import HTTPException
-import uuid
 from app.services.supabase_service import SupabaseService
 from app.schemas import contract as contract_schemas
-
-from app.models.contract import Contract
 from app.schemas.contract import ContractCreate, ContractUpdate
+from app.utils.ids import next_uuid
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +22,8 @@ class ContractService:
         limit: int = 100,
         campaign_id: Optional[str] = None,
         creator_id: Optional[str] = None,
-        status: Optional[str] = None
+        status: Optional[str] = None,
+        cursor: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """
         Get all contracts with optional filtering
@@ -36,7 +34,8 @@ class ContractService:
                 limit=limit,
                 campaign_id=campaign_id,
                 creator_id=creator_id,
-                status=status
+                status=status,
+                cursor=cursor
             )
         except Exception as e:
             logger.error(f"Error getting contracts: {e}")
@@ -65,14 +64,14 @@ class ContractService:
         """
         try:
             # Set default values
-            contract_dict = contract_data.model_dump()
-            contract_dict["id"] = str(uuid.uuid4())
+            contract_dict = contract_data.model_dump(mode="json", exclude_none=True)
+            contract_dict["id"] = next_uuid()
             contract_dict["status"] = "draft"
             contract_dict["created_at"] = datetime.utcnow().isoformat()
             contract_dict["updated_at"] = datetime.utcnow().isoformat()
             
             # Create contract in database
-            contract = await SupabaseService.create_contract(contract_schemas.ContractCreate(**contract_dict))
+            contract = await SupabaseService.create_contract(contract_dict)
             if not contract:
                 raise HTTPException(status_code=500, detail="Failed to create contract")
             
@@ -183,7 +182,7 @@ class ContractService:
             logger.error(f"Error generating contract document for {contract_id}: {e}")
             raise HTTPException(status_code=500, detail=f"Error generating contract document")
     
-    async def get_contract_by_id(self, db: Session, contract_id: str) -> Dict[str, Any]:
+    async def get_contract_by_id(self, contract_id: str) -> Dict[str, Any]:
         """
         Get contract by ID with detailed information
         """
@@ -196,7 +195,7 @@ class ContractService:
             logger.error(f"Error fetching contract by ID: {str(e)}")
             return None
     
-    async def generate_contract_pdf(self, db: Session, contract_id: str) -> Dict[str, Any]:
+    async def generate_contract_pdf(self, contract_id: str) -> Dict[str, Any]:
         """
         Generate a PDF version of the contract (mock implementation)
         """
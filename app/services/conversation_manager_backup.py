@@ -4,13 +4,19 @@ This service manages conversation state, messages, and provides analytics
 for influencer negotiations in the InfluencerFlow platform.
 """
 
+import asyncio
+import bisect
 import logging
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from typing import Dict, List, Any, Optional
-import uuid
 import json
 
+from app.utils.ids import next_uuid
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -31,20 +37,193 @@ class ConversationStatus(str, Enum):
     DECLINED = "declined"
     COMPLETED = "completed"
 
+# Records use explicit __slots__ (dataclass(slots=True) needs Python 3.10)
+# and have no field defaults, which slots would not allow on 3.9.
+
+@dataclass
+class Message:
+    """A single message in a negotiation conversation."""
+    __slots__ = ("id", "conversation_id", "role", "content", "timestamp", "metadata")
+    id: str
+    conversation_id: str
+    role: MessageRole
+    content: str
+    timestamp: Optional[str]
+    metadata: Dict[str, Any]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "conversation_id": self.conversation_id,
+            "role": self.role,
+            "content": self.content,
+            "timestamp": self.timestamp,
+            "metadata": self.metadata
+        }
+
+@dataclass
+class Conversation:
+    """State of a negotiation conversation."""
+    __slots__ = ("id", "campaign_brief", "creator_profile", "strategy", "deal_params",
+                 "status", "created_at", "updated_at", "message_count", "price_change_count",
+                 "initial_price")
+    id: str
+    campaign_brief: Dict[str, Any]
+    creator_profile: Dict[str, Any]
+    strategy: Dict[str, Any]
+    deal_params: Dict[str, Any]
+    status: ConversationStatus
+    created_at: str
+    updated_at: str
+    # Running aggregates, maintained on write for O(1) summaries
+    message_count: int
+    price_change_count: int
+    initial_price: float
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "campaign_brief": self.campaign_brief,
+            "creator_profile": self.creator_profile,
+            "strategy": self.strategy,
+            "deal_params": self.deal_params,
+            "status": self.status,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "message_count": self.message_count,
+            "price_change_count": self.price_change_count,
+            "initial_price": self.initial_price
+        }
+
+@dataclass
+class DealSnapshot:
+    """An entry in a conversation's deal history.
+    
+    Only the changed fields are stored: the initialization entry holds the
+    full initial deal and each later entry the delta it applied, so a deal
+    at any point is the initial entry updated with the following changes.
+    """
+    __slots__ = ("timestamp", "changes", "change_source", "notes")
+    timestamp: str
+    changes: Dict[str, Any]
+    change_source: str
+    notes: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "timestamp": self.timestamp,
+            "changes": self.changes,
+            "change_source": self.change_source,
+            "notes": self.notes
+        }
+
+# Negotiation progress by current price / creator rate: below 0.8 -> 60,
+# [0.8, 0.85) -> 70, [0.85, 0.9) -> 80, [0.9, 0.95) -> 90, 0.95 and up -> 95
+_PROGRESS_THRESHOLDS = (0.8, 0.85, 0.9, 0.95)
+_PROGRESS_VALUES = (60, 70, 80, 90, 95)
+
+# Kinds of buffered write events
+_MESSAGE = "message"
+_STATUS = "status"
+_DEAL = "deal"
+
 class ConversationManager:
-    """Service for managing negotiation conversations."""
+    """Service for managing negotiation conversations.
+    
+    Writes (messages, status and deal updates) are appended to a pending log
+    and applied in batches: when ``batch_size`` events are queued, or
+    ``max_wait`` seconds after the first queued event. Reads flush the log
+    first, so they always observe every accepted write.
+    """
     
-    def __init__(self):
+    def __init__(self, batch_size: int = 256, max_wait: float = 0.05):
         # In-memory storage - would be replaced with a database in production
-        self.conversations: Dict[str, Dict] = {}
-        self.messages: Dict[str, List[Dict]] = {}
-        self.deal_history: Dict[str, List[Dict]] = {}
+        self.conversations: Dict[str, Conversation] = {}
+        self.messages: Dict[str, List[Message]] = {}
+        self.deal_history: Dict[str, List[DealSnapshot]] = {}
+        # AI agent messages, indexed separately so insight reads skip the role filter
+        self._ai_messages: Dict[str, List[Message]] = {}
+        
+        # Pending write events: (kind, conversation_id, payload)
+        self.batch_size = batch_size
+        self.max_wait = max_wait
+        self._pending: deque = deque()
+        self._flush_task: Optional[asyncio.Task] = None
+        
+        # Timestamp cache, refreshed at most once per millisecond
+        self._cached_now: str = ""
+        self._cached_now_ts: float = float("-inf")
         logger.info("Conversation manager initialized")
     
+    def _now_iso(self) -> str:
+        """Current time in ISO format, reused for calls within the same millisecond."""
+        ts = time.monotonic()
+        if ts - self._cached_now_ts >= 0.001:
+            self._cached_now = datetime.now().isoformat()
+            self._cached_now_ts = ts
+        return self._cached_now
+    
+    def _enqueue(self, kind: str, conversation_id: str, payload: Any) -> None:
+        """Queue a write event and make sure it will be flushed."""
+        self._pending.append((kind, conversation_id, payload))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+            return
+        
+        if self._flush_task is not None and not self._flush_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop to flush from later, so apply the write now
+            self.flush()
+            return
+        self._flush_task = loop.create_task(self._flush_later())
+    
+    async def _flush_later(self) -> None:
+        """Flush pending events once the batch window has elapsed."""
+        await asyncio.sleep(self.max_wait)
+        self.flush()
+    
+    def flush(self) -> int:
+        """Apply all pending write events and return how many were applied."""
+        if not self._pending:
+            return 0
+        
+        events, self._pending = self._pending, deque()
+        # One timestamp covers the whole batch
+        now = self._now_iso()
+        new_messages: Dict[str, List[Message]] = defaultdict(list)
+        touched = set()
+        
+        for kind, conversation_id, payload in events:
+            touched.add(conversation_id)
+            if kind == _MESSAGE:
+                payload.timestamp = now
+                new_messages[conversation_id].append(payload)
+                if payload.role == MessageRole.AI_AGENT:
+                    self._ai_messages[conversation_id].append(payload)
+            elif kind == _STATUS:
+                self.conversations[conversation_id].status = payload
+            elif kind == _DEAL:
+                deal_params, rationale = payload
+                self._apply_deal_update(conversation_id, deal_params, rationale, now)
+        
+        # Message lists always exist: create_conversation initializes them
+        for conversation_id, batch in new_messages.items():
+            self.messages[conversation_id].extend(batch)
+            self.conversations[conversation_id].message_count += len(batch)
+        
+        for conversation_id in touched:
+            self.conversations[conversation_id].updated_at = now
+        
+        return len(events)
+    
     def create_conversation(self, campaign_brief: Dict, creator_profile: Dict, 
                            initial_strategy: Dict) -> str:
         """Create a new conversation and return its ID."""
-        conversation_id = str(uuid.uuid4())
+        conversation_id = next_uuid()
+        now = self._now_iso()
         
         # Set initial deal parameters
         initial_deal = {
@@ -56,47 +235,53 @@ class ConversationManager:
         }
         
         # Create conversation record
-        self.conversations[conversation_id] = {
-            "id": conversation_id,
-            "campaign_brief": campaign_brief,
-            "creator_profile": creator_profile,
-            "strategy": initial_strategy,
-            "deal_params": initial_deal,
-            "status": ConversationStatus.INITIALIZED,
-            "created_at": datetime.now().isoformat(),
-            "updated_at": datetime.now().isoformat()
-        }
+        self.conversations[conversation_id] = Conversation(
+            id=conversation_id,
+            campaign_brief=campaign_brief,
+            creator_profile=creator_profile,
+            strategy=initial_strategy,
+            deal_params=dict(initial_deal),
+            status=ConversationStatus.INITIALIZED,
+            created_at=now,
+            updated_at=now,
+            message_count=0,
+            price_change_count=0,
+            initial_price=initial_deal["price"]
+        )
         
-        # Initialize messages list
+        # Initialize messages lists
         self.messages[conversation_id] = []
+        self._ai_messages[conversation_id] = []
         
         # Initialize deal history
-        self.deal_history[conversation_id] = [{
-            "timestamp": datetime.now().isoformat(),
-            "deal_params": initial_deal,
-            "change_source": "initialization",
-            "notes": "Initial deal parameters"
-        }]
+        self.deal_history[conversation_id] = [DealSnapshot(
+            timestamp=now,
+            changes=initial_deal,
+            change_source="initialization",
+            notes="Initial deal parameters"
+        )]
         
         logger.info(f"Created new conversation: {conversation_id}")
         return conversation_id
     
-    def get_conversation(self, conversation_id: str) -> Optional[Dict]:
+    def get_conversation(self, conversation_id: str) -> Optional[Conversation]:
         """Get conversation by ID."""
+        self.flush()
         return self.conversations.get(conversation_id)
     
     def update_conversation_status(self, conversation_id: str, status: ConversationStatus, 
                                   reason: str = "") -> bool:
         """Update conversation status."""
-        if conversation_id not in self.conversations:
+        try:
+            self.conversations[conversation_id]
+        except KeyError:
             logger.warning(f"Attempted to update non-existent conversation: {conversation_id}")
             return False
         
-        self.conversations[conversation_id]["status"] = status
-        self.conversations[conversation_id]["updated_at"] = datetime.now().isoformat()
+        self._enqueue(_STATUS, conversation_id, status)
         
-        # Add system message about status change
-        self.add_message(
+        # Add system message about status change (existence already checked)
+        self._queue_message(
             conversation_id,
             MessageRole.SYSTEM,
             f"Conversation status changed to {status}",
@@ -108,115 +293,112 @@ class ConversationManager:
     
     def add_message(self, conversation_id: str, role: MessageRole, content: str, 
                    metadata: Optional[Dict] = None) -> bool:
-        """Add message to conversation."""
-        if conversation_id not in self.conversations:
+        """Queue a message for the conversation; it is stored on the next flush."""
+        try:
+            self.conversations[conversation_id]
+        except KeyError:
             logger.warning(f"Attempted to add message to non-existent conversation: {conversation_id}")
             return False
         
-        message = {
-            "id": str(uuid.uuid4()),
-            "conversation_id": conversation_id,
-            "role": role,
-            "content": content,
-            "timestamp": datetime.now().isoformat(),
-            "metadata": metadata or {}
-        }
-        
-        if conversation_id not in self.messages:
-            self.messages[conversation_id] = []
-            
-        self.messages[conversation_id].append(message)
-        self.conversations[conversation_id]["updated_at"] = datetime.now().isoformat()
-        
-        logger.info(f"Added {role} message to conversation {conversation_id}")
+        self._queue_message(conversation_id, role, content, metadata)
         return True
     
-    def get_messages(self, conversation_id: str) -> List[Dict]:
+    def _queue_message(self, conversation_id: str, role: MessageRole, content: str,
+                       metadata: Optional[Dict] = None) -> None:
+        """Queue a message for a conversation known to exist."""
+        # The timestamp is assigned when the batch is flushed
+        message = Message(
+            id=next_uuid(),
+            conversation_id=conversation_id,
+            role=role,
+            content=content,
+            timestamp=None,
+            metadata=metadata or {}
+        )
+        self._enqueue(_MESSAGE, conversation_id, message)
+        
+        logger.debug(f"Queued {role} message for conversation {conversation_id}")
+    
+    def get_messages(self, conversation_id: str) -> List[Message]:
         """Get all messages for a conversation."""
+        self.flush()
         return self.messages.get(conversation_id, [])
     
     def update_deal_parameters(self, conversation_id: str, deal_params: Dict, 
                               rationale: str) -> bool:
-        """Update deal parameters with historical tracking."""
-        if conversation_id not in self.conversations:
+        """Queue a deal parameter update; history is recorded on the next flush."""
+        try:
+            self.conversations[conversation_id]
+        except KeyError:
             logger.warning(f"Attempted to update non-existent conversation: {conversation_id}")
             return False
         
-        # Get current deal parameters
-        current_deal = self.conversations[conversation_id]["deal_params"]
-        
-        # Create a merged deal (with current values for any missing keys)
-        updated_deal = {**current_deal, **deal_params}
+        self._enqueue(_DEAL, conversation_id, (deal_params, rationale))
+        return True
+    
+    def _apply_deal_update(self, conversation_id: str, deal_params: Dict,
+                           rationale: str, now: str) -> None:
+        """Apply a deal parameter update with historical tracking."""
+        conversation = self.conversations[conversation_id]
+        current_deal = conversation.deal_params
         
-        # Update conversation with new parameters
-        self.conversations[conversation_id]["deal_params"] = updated_deal
-        self.conversations[conversation_id]["updated_at"] = datetime.now().isoformat()
+        # Record only the fields that actually change, then update the live deal in place
+        changes = {k: v for k, v in deal_params.items() if current_deal.get(k) != v}
+        current_deal.update(changes)
+        if "price" in changes:
+            conversation.price_change_count += 1
         
         # Add to deal history
-        if conversation_id not in self.deal_history:
-            self.deal_history[conversation_id] = []
-            
-        self.deal_history[conversation_id].append({
-            "timestamp": datetime.now().isoformat(),
-            "deal_params": updated_deal,
-            "previous_params": current_deal,
-            "changes": {k: v for k, v in deal_params.items() if k in current_deal and current_deal[k] != v},
-            "rationale": rationale
-        })
+        self.deal_history[conversation_id].append(DealSnapshot(
+            timestamp=now,
+            changes=changes,
+            change_source="update",
+            notes=rationale
+        ))
         
         logger.info(f"Updated deal parameters for conversation {conversation_id}")
-        return True
     
     def get_conversation_summary(self, conversation_id: str) -> Optional[Dict]:
         """Get a summary of the conversation status and deal parameters."""
-        if conversation_id not in self.conversations:
+        try:
+            conversation = self.conversations[conversation_id]
+        except KeyError:
             logger.warning(f"Attempted to get summary for non-existent conversation: {conversation_id}")
             return None
         
-        conversation = self.conversations[conversation_id]
-        messages = self.get_messages(conversation_id)
-        deal_history = self.deal_history.get(conversation_id, [])
+        self.flush()
         
         # Calculate negotiation progress
-        initial_price = deal_history[0]["deal_params"]["price"] if deal_history else 0
-        current_price = conversation["deal_params"]["price"]
-        creator_rate = conversation["creator_profile"].get("typical_rate", 0)
+        initial_price = conversation.initial_price
+        current_price = conversation.deal_params["price"]
+        creator_rate = conversation.creator_profile.get("typical_rate", 0)
         
         # Simplified progress calculation
         progress = 0
         if creator_rate > 0 and initial_price > 0:
             # Progress based on how close the current price is to creator's typical rate
             price_ratio = current_price / creator_rate
-            if price_ratio >= 0.95:  # Very close to typical rate
-                progress = 95
-            elif price_ratio >= 0.9:
-                progress = 90
-            elif price_ratio >= 0.85:
-                progress = 80
-            elif price_ratio >= 0.8:
-                progress = 70
-            else:
-                progress = 60
+            progress = _PROGRESS_VALUES[bisect.bisect_right(_PROGRESS_THRESHOLDS, price_ratio)]
         
         # If status is agreement reached, set progress to 100
-        if conversation["status"] == ConversationStatus.AGREEMENT_REACHED:
+        if conversation.status == ConversationStatus.AGREEMENT_REACHED:
             progress = 100
         
         return {
             "conversation_id": conversation_id,
-            "status": conversation["status"],
-            "message_count": len(messages),
+            "status": conversation.status,
+            "message_count": conversation.message_count,
             "deal_summary": {
                 "creator_typical_rate": creator_rate,
                 "initial_offer": initial_price,
                 "current_offer": current_price,
                 "negotiation_progress": progress,
-                "price_changes": len(deal_history) - 1,
-                "total_price_changes": sum(1 for d in deal_history if "changes" in d and "price" in d["changes"]),
-                "timeline": conversation["deal_params"]["timeline"],
-                "deliverables": conversation["deal_params"].get("deliverables", [])
+                "price_changes": len(self.deal_history[conversation_id]) - 1,
+                "total_price_changes": conversation.price_change_count,
+                "timeline": conversation.deal_params["timeline"],
+                "deliverables": conversation.deal_params.get("deliverables", [])
             },
-            "last_updated": conversation["updated_at"]
+            "last_updated": conversation.updated_at
         }
     
     def get_negotiation_insights(self, conversation_id: str) -> List[str]:
@@ -225,16 +407,17 @@ class ConversationManager:
             logger.warning(f"Attempted to get insights for non-existent conversation: {conversation_id}")
             return []
         
-        # Extract insights from AI agent messages
-        insights = []
-        for message in self.get_messages(conversation_id):
-            if message["role"] == MessageRole.AI_AGENT and "metadata" in message:
-                metadata = message["metadata"]
-                if "insights" in metadata and isinstance(metadata["insights"], list):
-                    insights.extend(metadata["insights"])
+        self.flush()
         
-        # Return unique insights (no duplicates)
-        return list(set(insights))
+        # Extract unique insights from AI agent messages, in first-seen order
+        seen = set()
+        return [
+            insight
+            for message in self._ai_messages.get(conversation_id, ())
+            if isinstance(message.metadata.get("insights"), list)
+            for insight in message.metadata["insights"]
+            if not (insight in seen or seen.add(insight))
+        ]
 
 # Create a singleton instance
 conversation_manager = ConversationManager()
\ No newline at end of file
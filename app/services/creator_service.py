@@ -1,66 +1,123 @@
 import logging
-from typing import List, Dict, Any, Optional
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Set
 from uuid import UUID
-from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_, func
 
-from app.models.creator import Creator
 from app.schemas.creator import CreatorCreate, CreatorUpdate
 
 logger = logging.getLogger(__name__)
 
 
+def _to_int(value: Any, default: int = 0) -> int:
+    """Coerce a count that may arrive as a string (or be missing) to an int"""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+class _MockCreatorIndex:
+    """
+    Lookup tables over the mock creators: inverted indexes for the equality
+    filters and sorted columns for the range filters. Entries are positions
+    in the creators list.
+    """
+    
+    def __init__(self, creators: List[Dict[str, Any]]):
+        # Normalize numeric counts once so downstream code can do plain arithmetic
+        for c in creators:
+            c["followers_count_numeric"] = _to_int(c.get("followers_count_numeric"))
+            c["avg_views"] = _to_int(c.get("avg_views"))
+        
+        self.creators = creators
+        self.by_id: Dict[str, Dict[str, Any]] = {c["id"]: c for c in creators}
+        # Case-folded names for search, kept apart so creator dicts are returned unchanged
+        self.names_casefolded: List[str] = [c["name"].casefold() for c in creators]
+        self.by_platform: Dict[str, Set[int]] = defaultdict(set)
+        self.by_niche: Dict[str, Set[int]] = defaultdict(set)
+        self.by_country: Dict[str, Set[int]] = defaultdict(set)
+        self.by_language: Dict[str, Set[int]] = defaultdict(set)
+        for i, c in enumerate(creators):
+            self.by_platform[c["platform"]].add(i)
+            self.by_niche[c["niche"]].add(i)
+            self.by_country[c["country"]].add(i)
+            self.by_language[c["language"]].add(i)
+        
+        followers = sorted((c["followers_count_numeric"], i) for i, c in enumerate(creators))
+        self.followers_values = [v for v, _ in followers]
+        self.followers_positions = [i for _, i in followers]
+        engagement = sorted((c["engagement_rate"], i) for i, c in enumerate(creators))
+        self.engagement_values = [v for v, _ in engagement]
+        self.engagement_positions = [i for _, i in engagement]
+    
+    @staticmethod
+    def _range(values: List[Any], positions: List[int], low: Any = None, high: Any = None) -> Set[int]:
+        start = bisect_left(values, low) if low is not None else 0
+        end = bisect_right(values, high) if high is not None else len(values)
+        return set(positions[start:end])
+    
+    def followers_between(self, low: Optional[int], high: Optional[int]) -> Set[int]:
+        return self._range(self.followers_values, self.followers_positions, low, high)
+    
+    def engagement_at_least(self, low: float) -> Set[int]:
+        return self._range(self.engagement_values, self.engagement_positions, low)
+
+
+@lru_cache(maxsize=None)
+def _get_mock_index() -> _MockCreatorIndex:
+    """Build the mock creator lookup tables once, on first use"""
+    from app.utils.mock_data import MOCK_CREATORS
+    return _MockCreatorIndex(MOCK_CREATORS)
+
+
 class CreatorService:
     """
     Service for managing creator-related operations
     """
     
-    async def get_creators(self, db: Session, skip: int = 0, limit: int = 20,
-                         search: Optional[str] = None, platform: Optional[str] = None,
-                         niche: Optional[str] = None, min_followers: Optional[int] = None,
-                         max_followers: Optional[int] = None, country: Optional[str] = None,
-                         language: Optional[str] = None, min_engagement: Optional[float] = None) -> List[Creator]:
+    def get_creators(self, skip: int = 0, limit: int = 20,
+                     search: Optional[str] = None, platform: Optional[str] = None,
+                     niche: Optional[str] = None, min_followers: Optional[int] = None,
+                     max_followers: Optional[int] = None, country: Optional[str] = None,
+                     language: Optional[str] = None, min_engagement: Optional[float] = None) -> List[Dict[str, Any]]:
         """
         Get creators with optional filtering
         """
         try:
             # In a real implementation, this would query the database
             # For MVP, we'll return mock data
-            from app.utils.mock_data import MOCK_CREATORS
-            
-            # Apply filters to mock data
-            filtered_creators = MOCK_CREATORS
-            
-            # Apply search filter
-            if search:
-                search = search.lower()
-                filtered_creators = [c for c in filtered_creators if search in c["name"].lower()]
+            index = _get_mock_index()
             
-            # Apply platform filter
+            # Collect the candidate positions matched by each indexed filter
+            matches: List[Set[int]] = []
             if platform:
-                filtered_creators = [c for c in filtered_creators if c["platform"] == platform]
-            
-            # Apply niche filter
+                matches.append(index.by_platform.get(platform, set()))
             if niche:
-                filtered_creators = [c for c in filtered_creators if c["niche"] == niche]
-            
-            # Apply followers range filter
-            if min_followers:
-                filtered_creators = [c for c in filtered_creators if c["followers_count_numeric"] >= min_followers]
-            if max_followers:
-                filtered_creators = [c for c in filtered_creators if c["followers_count_numeric"] <= max_followers]
-            
-            # Apply country filter
+                matches.append(index.by_niche.get(niche, set()))
             if country:
-                filtered_creators = [c for c in filtered_creators if c["country"] == country]
-            
-            # Apply language filter
+                matches.append(index.by_country.get(country, set()))
             if language:
-                filtered_creators = [c for c in filtered_creators if c["language"] == language]
-            
-            # Apply engagement filter
+                matches.append(index.by_language.get(language, set()))
+            if min_followers or max_followers:
+                matches.append(index.followers_between(min_followers or None, max_followers or None))
             if min_engagement:
-                filtered_creators = [c for c in filtered_creators if c["engagement_rate"] >= min_engagement]
+                matches.append(index.engagement_at_least(min_engagement))
+            
+            # Intersect the candidates, keeping the original creator order
+            if matches:
+                positions = sorted(set.intersection(*matches))
+            else:
+                positions = range(len(index.creators))
+            
+            # Apply search filter on the remaining candidates
+            if search:
+                search = search.casefold()
+                names = index.names_casefolded
+                positions = [i for i in positions if search in names[i]]
+            
+            filtered_creators = [index.creators[i] for i in positions]
             
             # Apply pagination
             paginated_creators = filtered_creators[skip:skip + limit]
@@ -82,22 +139,14 @@ class CreatorService:
             logger.error(f"Error fetching creators: {str(e)}")
             return {"creators": [], "total": 0, "filters_applied": {}}
     
-    async def get_creator_by_id(self, db: Session, creator_id: str, campaign_id: Optional[str] = None) -> Dict[str, Any]:
+    def get_creator_by_id(self, creator_id: str, campaign_id: Optional[str] = None) -> Dict[str, Any]:
         """
         Get detailed creator profile with optional campaign match analysis
         """
         try:
             # In a real implementation, this would query the database
             # For MVP, we'll return mock data
-            from app.utils.mock_data import MOCK_CREATORS
-            
-            # Find creator by ID
-            creator = None
-            for c in MOCK_CREATORS:
-                if c["id"] == creator_id:
-                    creator = c
-                    break
-            
+            creator = _get_mock_index().by_id.get(creator_id)
             if not creator:
                 return None
             
@@ -140,7 +189,7 @@ class CreatorService:
             logger.error(f"Error fetching creator by ID: {str(e)}")
             return None
     
-    async def create_creator(self, db: Session, creator: CreatorCreate) -> Creator:
+    def create_creator(self, creator: CreatorCreate) -> Optional[Dict[str, Any]]:
         """
         Create a new creator
         """
@@ -176,23 +225,16 @@ class CreatorService:
             logger.error(f"Error creating creator: {str(e)}")
             return None
     
-    async def update_creator(self, db: Session, creator_id: str, creator: CreatorUpdate) -> Creator:
+    def update_creator(self, creator_id: str, creator: CreatorUpdate) -> Optional[Dict[str, Any]]:
         """
         Update an existing creator
         """
         try:
             # In a real implementation, this would update the record in the database
             # For MVP, we'll just return a mock with the updated data
-            from app.utils.mock_data import MOCK_CREATORS
             from datetime import datetime
             
-            # Find creator by ID
-            existing_creator = None
-            for c in MOCK_CREATORS:
-                if c["id"] == creator_id:
-                    existing_creator = c
-                    break
-            
+            existing_creator = _get_mock_index().by_id.get(creator_id)
             if not existing_creator:
                 return None
             
@@ -210,23 +252,14 @@ class CreatorService:
             logger.error(f"Error updating creator: {str(e)}")
             return None
     
-    async def delete_creator(self, db: Session, creator_id: str) -> bool:
+    def delete_creator(self, creator_id: str) -> bool:
         """
         Delete a creator
         """
         try:
             # In a real implementation, this would delete the record from the database
             # For MVP, we'll just return a success flag
-            from app.utils.mock_data import MOCK_CREATORS
-            
-            # Check if creator exists
-            creator_exists = False
-            for c in MOCK_CREATORS:
-                if c["id"] == creator_id:
-                    creator_exists = True
-                    break
-            
-            return creator_exists
+            return creator_id in _get_mock_index().by_id
             
         except Exception as e:
             logger.error(f"Error deleting creator: {str(e)}")
@@ -1,14 +1,58 @@
+import asyncio
+import logging
 import httpx
-from typing import Dict, Optional, Any, Union
-import json
+import orjson
+from typing import AsyncGenerator, AsyncIterator, Dict, List, Optional, Any, Union
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
+# Campaign brief sent to the voice agent, filled from _BRIEF_DEFAULTS keys
+_BRIEF_TMPL = (
+    "{brand_name} is launching a strategic marketing campaign for its latest innovation — "
+    "the {product_name}, {product_description}. \n"
+    "        The campaign's primary objective is to {campaign_goal} by highlighting the "
+    "{product_name}'s features, such as {key_usecases}. \n"
+    "        Through a mix of visually engaging and informative content, the campaign will "
+    "position {product_name} as a must-have tool for anyone serious about improving their lifestyle. \n"
+    "        Targeting {target_audience}, the campaign will roll out across multiple digital "
+    "channels including social media, influencer partnerships, and digital marketing. \n"
+    "        Creative messaging will focus on empowering users with a budget of "
+    "${total_budget:,.0f} for this campaign."
+)
+
+_BRIEF_DEFAULTS = {
+    "brand_name": "",
+    "product_name": "",
+    "product_description": "",
+    "target_audience": "",
+    "total_budget": 0,
+    "key_usecases": "",
+    "campaign_goal": "increase brand awareness"
+}
+
 class ElevenLabsService:
     def __init__(self):
         self.api_key = settings.ELEVENLABS_API_KEY
         self.base_url = "https://api.elevenlabs.io/v1/convai"
         self.agent_id = settings.ELEVENLABS_AGENT_ID
         self.phone_number_id = settings.ELEVENLABS_PHONE_NUMBER_ID
+        
+        # Sent with request bodies that are already orjson-encoded
+        self._json_headers = {"Content-Type": "application/json"}
+        
+        # One pooled client for all calls, so connections (and TLS sessions) are reused
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers={"xi-api-key": self.api_key or ""},
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            timeout=30.0
+        )
+    
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client"""
+        await self._client.aclose()
     
     async def initiate_outbound_call(
         self,
@@ -18,21 +62,10 @@ class ElevenLabsService:
     ) -> Dict[str, Any]:
         """Initiate outbound call to creator"""
         
-        # Format followers count safely
-        followers_count = creator_data.get('followers_count', 0)
-        if isinstance(followers_count, str):
-            try:
-                followers_count = int(followers_count)
-            except (ValueError, TypeError):
-                followers_count = 0
-                
-        # Format average views safely
-        avg_views = creator_data.get('avg_views', 0)
-        if isinstance(avg_views, str):
-            try:
-                avg_views = int(avg_views)
-            except (ValueError, TypeError):
-                avg_views = 0
+        # Both columns are integers in the creators table (followers_count is
+        # the display string, e.g. "125K"), so no parsing is needed here
+        followers_count = creator_data.get("followers_count_numeric") or 0
+        avg_views = creator_data.get("avg_views") or 0
         
         # Create a single influencer profile string
         influencer_profile = {
@@ -51,7 +84,7 @@ class ElevenLabsService:
         
         # Prepare dynamic variables for personalization
         dynamic_variables = {
-            "InfluencerProfile": json.dumps(influencer_profile),
+            "InfluencerProfile": orjson.dumps(influencer_profile).decode(),
             "campaignBrief": self._generate_campaign_brief(campaign_data),
             "priceRange": f"{campaign_data.get('min_budget', 0)}-{campaign_data.get('max_budget', 0)}",
             "influencerName": creator_data.get("name", "")
@@ -66,31 +99,42 @@ class ElevenLabsService:
             }
         }
         
-        headers = {
-            "xi-api-key": self.api_key,
-            "Content-Type": "application/json"
-        }
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/twilio/outbound-call",
-                headers=headers,
-                json=payload
-            )
-            response.raise_for_status()
-            return response.json()
+        # Encode with orjson rather than letting httpx re-encode via stdlib json
+        response = await self._client.post(
+            "/twilio/outbound-call",
+            content=orjson.dumps(payload),
+            headers=self._json_headers
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)
     
     async def get_conversation_analysis(self, conversation_id: str) -> Dict[str, Any]:
         """Get detailed conversation analysis"""
-        headers = {"xi-api-key": self.api_key}
+        response = await self._client.get(f"/conversations/{conversation_id}")
+        response.raise_for_status()
+        return response.json()
+    
+    async def get_many_analyses(
+        self,
+        conversation_ids: List[str],
+        *,
+        concurrency: int = 16
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get analyses for several conversations concurrently, keyed by ID (failed fetches are logged and skipped)"""
+        semaphore = asyncio.Semaphore(concurrency)
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/conversations/{conversation_id}",
-                headers=headers
-            )
-            response.raise_for_status()
-            return response.json()
+        async def fetch(conversation_id: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.get_conversation_analysis(conversation_id)
+        
+        results = await asyncio.gather(*(fetch(cid) for cid in conversation_ids), return_exceptions=True)
+        analyses = {}
+        for conversation_id, result in zip(conversation_ids, results):
+            if isinstance(result, BaseException):
+                logger.error("Error fetching analysis for conversation %s: %s", conversation_id, result)
+                continue
+            analyses[conversation_id] = result
+        return analyses
     
     async def list_conversations(
         self,
@@ -100,7 +144,6 @@ class ElevenLabsService:
         page_size: int = 30
     ) -> Dict[str, Any]:
         """List conversations with filters"""
-        headers = {"xi-api-key": self.api_key}
         params = {}
         
         # Add optional parameters
@@ -112,31 +155,36 @@ class ElevenLabsService:
             params["agent_id"] = agent_id
         if call_successful:
             params["call_successful"] = call_successful
-            
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/conversations",
-                headers=headers,
-                params=params
+        
+        response = await self._client.get("/conversations", params=params)
+        response.raise_for_status()
+        return response.json()
+    
+    async def list_all_conversations(
+        self,
+        agent_id: Optional[str] = None,
+        call_successful: Optional[str] = None,
+        page_size: int = 30
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over all matching conversations, following the pagination cursor"""
+        cursor = None
+        while True:
+            page = await self.list_conversations(
+                agent_id=agent_id,
+                call_successful=call_successful,
+                cursor=cursor,
+                page_size=page_size
             )
-            response.raise_for_status()
-            return response.json()
+            for conversation in page.get("conversations", []):
+                yield conversation
+            
+            cursor = page.get("next_cursor")
+            if not cursor or not page.get("has_more", True):
+                break
     
     def _generate_campaign_brief(self, campaign_data: Dict[str, Any]) -> str:
         """Generate comprehensive campaign brief from campaign data"""
-        brand_name = campaign_data.get("brand_name", "")
-        product_name = campaign_data.get("product_name", "")
-        product_description = campaign_data.get("product_description", "")
-        target_audience = campaign_data.get("target_audience", "")
-        total_budget = campaign_data.get("total_budget", 0)
-        key_usecases = campaign_data.get("key_usecases", "")
-        campaign_goal = campaign_data.get("campaign_goal", "increase brand awareness")
-        
-        return f"""{brand_name} is launching a strategic marketing campaign for its latest innovation — the {product_name}, {product_description}. 
-        The campaign's primary objective is to {campaign_goal} by highlighting the {product_name}'s features, such as {key_usecases}. 
-        Through a mix of visually engaging and informative content, the campaign will position {product_name} as a must-have tool for anyone serious about improving their lifestyle. 
-        Targeting {target_audience}, the campaign will roll out across multiple digital channels including social media, influencer partnerships, and digital marketing. 
-        Creative messaging will focus on empowering users with a budget of ${total_budget:,.0f} for this campaign."""
+        return _BRIEF_TMPL.format(**{k: campaign_data.get(k, d) for k, d in _BRIEF_DEFAULTS.items()})
     
     def _determine_collaboration_type(self, campaign_data: Dict[str, Any]) -> str:
         """Determine collaboration type based on campaign data"""
@@ -147,14 +195,22 @@ class ElevenLabsService:
         else:
             return "content collaboration"
     
-    async def get_conversation_audio(self, conversation_id: str) -> bytes:
-        """Get audio recording of a conversation"""
-        headers = {"xi-api-key": self.api_key}
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/conversations/{conversation_id}/audio",
-                headers=headers
-            )
+    async def stream_conversation_audio(
+        self,
+        conversation_id: str,
+        chunk_size: int = 65536
+    ) -> AsyncGenerator[bytes, None]:
+        """Stream the audio recording of a conversation in chunks"""
+        async with self._client.stream("GET", f"/conversations/{conversation_id}/audio") as response:
             response.raise_for_status()
-            return response.content 
\ No newline at end of file
+            async for chunk in response.aiter_bytes(chunk_size):
+                yield chunk
+
+
+# Shared instance so every request reuses the same connection pool
+elevenlabs_service = ElevenLabsService()
+
+
+def get_elevenlabs_service() -> ElevenLabsService:
+    """Dependency to get the shared ElevenLabs service"""
+    return elevenlabs_service
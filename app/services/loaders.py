@@ -0,0 +1,20 @@
+from typing import Any, Dict, List, Optional
+from aiodataloader import DataLoader
+from app.services.supabase_service import SupabaseService
+
+
+class CreatorLoader(DataLoader):
+    """
+    Coalesces creator lookups made during one request into a single IN (...) query
+    """
+    
+    async def batch_load_fn(self, creator_ids: List[str]) -> List[Optional[Dict[str, Any]]]:
+        creators = await SupabaseService.get_creators_by_ids(list(creator_ids))
+        by_id = {creator["id"]: creator for creator in creators}
+        return [by_id.get(creator_id) for creator_id in creator_ids]
+
+
+async def get_creator_loader() -> CreatorLoader:
+    """Dependency to get a creator loader scoped to the current request"""
+    # Async so the loader is created on the running event loop, not in the threadpool
+    return CreatorLoader()
@@ -1,15 +1,32 @@
 import logging
+import warnings
 from typing import List, Dict, Any, Optional
 from uuid import UUID
-from datetime import datetime
+from datetime import datetime, timezone
 from fastapi import HTTPException
 from app.services.supabase_service import SupabaseService
+from app.services.loaders import CreatorLoader
 from app.schemas import outreach as outreach_schemas
 import uuid
 
 logger = logging.getLogger(__name__)
 
 
+def _summarize_message(content: Dict[str, Any]) -> str:
+    message = content.get("message", "")
+    if len(message) > 50:
+        return f"{message[:50]}..."
+    return message
+
+
+# Dashboard content summaries, checked in order; the first key present wins
+_SUMMARY_FNS = {
+    "subject": lambda content: f"Email: {content.get('subject', '')}",
+    "recording_url": lambda content: "Call recording available",
+    "message": _summarize_message,
+}
+
+
 class OutreachService:
     """
     Service for managing outreach-related operations
@@ -19,26 +36,42 @@ class OutreachService:
         self.db = db
     
     @staticmethod
-    async def get_outreach_logs(
-        skip: int = 0,
-        limit: int = 100,
+    async def list_logs(
+        *,
         campaign_id: Optional[str] = None,
-        creator_id: Optional[str] = None
+        creator_id: Optional[str] = None,
+        limit: int = 100,
+        skip: int = 0,
+        cursor: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """
-        Get all outreach logs with optional filtering
+        Get outreach logs with optional filtering, newest first
         """
         try:
             return await SupabaseService.get_outreach_logs(
-                skip=skip, 
+                skip=skip,
                 limit=limit,
                 campaign_id=campaign_id,
-                creator_id=creator_id
+                creator_id=creator_id,
+                cursor=cursor
             )
         except Exception as e:
-            logger.error(f"Error getting outreach logs: {e}")
+            logger.error("Error getting outreach logs: %s", e)
             raise HTTPException(status_code=500, detail="Error retrieving outreach logs")
     
+    @staticmethod
+    async def get_outreach_logs(
+        skip: int = 0,
+        limit: int = 100,
+        campaign_id: Optional[str] = None,
+        creator_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Deprecated: use list_logs
+        """
+        warnings.warn("get_outreach_logs is deprecated, use list_logs", DeprecationWarning, stacklevel=2)
+        return await OutreachService.list_logs(skip=skip, limit=limit, campaign_id=campaign_id, creator_id=creator_id)
+    
     @staticmethod
     async def get_outreach_log(log_id: str) -> Dict[str, Any]:
         """
@@ -52,7 +85,7 @@ class OutreachService:
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"Error getting outreach log {log_id}: {e}")
+            logger.error("Error getting outreach log %s: %s", log_id, e)
             raise HTTPException(status_code=500, detail=f"Error retrieving outreach log {log_id}")
     
     @staticmethod
@@ -63,7 +96,7 @@ class OutreachService:
         try:
             return await SupabaseService.create_outreach_log(log_data)
         except Exception as e:
-            logger.error(f"Error creating outreach log: {e}")
+            logger.error("Error creating outreach log: %s", e)
             raise HTTPException(status_code=500, detail="Error creating outreach log")
     
     @staticmethod
@@ -72,46 +105,35 @@ class OutreachService:
         Update an existing outreach log
         """
         try:
-            # Check if log exists
-            existing_log = await SupabaseService.get_outreach_log(log_id)
-            if not existing_log:
-                raise HTTPException(status_code=404, detail=f"Outreach log with ID {log_id} not found")
-            
-            # Update log
             update_data = log_data.model_dump(exclude_unset=True)
             
+            # The update returns the affected row, so no row means no such log
             updated_log = await SupabaseService.update_outreach_log(log_id, update_data)
             if not updated_log:
-                raise HTTPException(status_code=500, detail=f"Failed to update outreach log {log_id}")
+                raise HTTPException(status_code=404, detail=f"Outreach log with ID {log_id} not found")
             
             return updated_log
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"Error updating outreach log {log_id}: {e}")
+            logger.error("Error updating outreach log %s: %s", log_id, e)
             raise HTTPException(status_code=500, detail=f"Error updating outreach log {log_id}")
     
     @staticmethod
     async def get_outreach_history_by_campaign(campaign_id: str) -> List[Dict[str, Any]]:
         """
-        Get all outreach logs for a specific campaign
+        Deprecated: use list_logs(campaign_id=..., limit=1000)
         """
-        try:
-            return await SupabaseService.get_outreach_logs(campaign_id=campaign_id, limit=1000)
-        except Exception as e:
-            logger.error(f"Error getting outreach logs for campaign {campaign_id}: {e}")
-            raise HTTPException(status_code=500, detail=f"Error retrieving outreach logs for campaign {campaign_id}")
+        warnings.warn("get_outreach_history_by_campaign is deprecated, use list_logs", DeprecationWarning, stacklevel=2)
+        return await OutreachService.list_logs(campaign_id=campaign_id, limit=1000)
     
     @staticmethod
     async def get_outreach_history_by_creator(creator_id: str) -> List[Dict[str, Any]]:
         """
-        Get all outreach logs for a specific creator
+        Deprecated: use list_logs(creator_id=..., limit=1000)
         """
-        try:
-            return await SupabaseService.get_outreach_logs(creator_id=creator_id, limit=1000)
-        except Exception as e:
-            logger.error(f"Error getting outreach logs for creator {creator_id}: {e}")
-            raise HTTPException(status_code=500, detail=f"Error retrieving outreach logs for creator {creator_id}")
+        warnings.warn("get_outreach_history_by_creator is deprecated, use list_logs", DeprecationWarning, stacklevel=2)
+        return await OutreachService.list_logs(creator_id=creator_id, limit=1000)
     
     @staticmethod
     async def send_outreach_email(
@@ -148,70 +170,74 @@ class OutreachService:
                 "timestamp": log["timestamp"]
             }
         except Exception as e:
-            logger.error(f"Error sending outreach email: {e}")
+            logger.error("Error sending outreach email: %s", e)
             raise HTTPException(status_code=500, detail="Error sending outreach email")
     
-    async def get_outreach_dashboard(self, campaign_filter: Optional[str] = None, db=None) -> Dict[str, Any]:
+    async def get_outreach_dashboard(
+        self,
+        campaign_filter: Optional[str] = None,
+        creator_loader: Optional[CreatorLoader] = None
+    ) -> Dict[str, Any]:
         """
         Get outreach management dashboard
         """
         try:
-            # Get all outreach logs with filtering if campaign_filter is provided
-            logs = await SupabaseService.get_outreach_logs(
-                campaign_id=campaign_filter,
-                limit=100
-            )
+            # Get the most recent outreach logs with filtering if campaign_filter is provided
+            logs = await OutreachService.list_logs(campaign_id=campaign_filter, limit=100)
             
-            # Calculate summary statistics
-            total_contacts = len(logs)
+            # Summary statistics are pre-aggregated per campaign in the database
+            summary = {
+                "total_contacts": 0,
+                "calls_completed": 0,
+                "email_replies": 0,
+                "recordings": 0
+            }
+            try:
+                summary_rows = await SupabaseService.get_outreach_summary(campaign_filter)
+            except Exception as e:
+                # Missing or unpopulated view: count the fetched logs instead
+                logger.warning("Outreach summary view unavailable, counting recent logs: %s", e)
+                summary_rows = [self._count_logs(logs)]
+            for row in summary_rows:
+                for key in summary:
+                    summary[key] += row.get(key) or 0
             
-            # Count various types of interactions
-            calls_completed = sum(1 for log in logs if log.get("channel") == "call" and log.get("status") == "completed")
-            email_replies = sum(1 for log in logs if log.get("channel") == "email" and log.get("message_type") == "reply")
-            recordings = sum(1 for log in logs if log.get("channel") == "call" and log.get("content", {}).get("recording_url"))
+            # Fetch creator info for all logs through the request's loader, so these
+            # lookups share one batched query with any others in the same request
+            creator_loader = creator_loader or CreatorLoader()
+            creator_ids = list({log["creator_id"] for log in logs if log.get("creator_id")})
+            creators = {
+                creator["id"]: {
+                    "id": creator.get("id"),
+                    "name": creator.get("name"),
+                    "platform": creator.get("platform"),
+                    "followers_count": creator.get("followers_count")
+                }
+                for creator in await creator_loader.load_many(creator_ids)
+                if creator
+            }
             
             # Format the logs for display with related creator and campaign info
             formatted_logs = []
             for log in logs:
-                # Get creator info for each log if available
-                creator_info = {}
-                if creator_id := log.get("creator_id"):
-                    try:
-                        creator = await SupabaseService.get_creator(creator_id)
-                        if creator:
-                            creator_info = {
-                                "id": creator.get("id"),
-                                "name": creator.get("name"),
-                                "platform": creator.get("platform"),
-                                "followers_count": creator.get("followers_count")
-                            }
-                    except Exception as e:
-                        logger.warning(f"Error fetching creator info for dashboard: {e}")
-                
-                # Add to formatted logs
                 formatted_logs.append({
                     "id": log.get("id"),
-                    "timestamp": log.get("timestamp"),
+                    "timestamp": log.get("created_at"),
                     "channel": log.get("channel"),
                     "message_type": log.get("message_type"),
                     "status": log.get("status"),
-                    "creator": creator_info,
+                    "creator": creators.get(log.get("creator_id"), {}),
                     "campaign_id": log.get("campaign_id"),
                     "content_summary": self._summarize_content(log.get("content", {}))
                 })
             
             return {
-                "summary": {
-                    "total_contacts": total_contacts,
-                    "calls_completed": calls_completed,
-                    "email_replies": email_replies,
-                    "recordings": recordings
-                },
+                "summary": summary,
                 "outreach_log": formatted_logs
             }
             
         except Exception as e:
-            logger.error(f"Error fetching outreach dashboard: {str(e)}")
+            logger.error("Error fetching outreach dashboard: %s", e)
             # Return empty dashboard data structure on error
             return {
                 "summary": {
@@ -223,20 +249,28 @@ class OutreachService:
                 "outreach_log": []
             }
     
+    @staticmethod
+    def _count_logs(logs: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Dashboard summary counts for a list of outreach logs"""
+        calls = [log for log in logs if log.get("channel") == "call"]
+        return {
+            "total_contacts": len(logs),
+            "calls_completed": sum(1 for log in calls if log.get("status") == "completed"),
+            "email_replies": sum(
+                1 for log in logs
+                if log.get("channel") == "email" and log.get("message_type") == "reply"
+            ),
+            "recordings": sum(1 for log in calls if (log.get("content") or {}).get("recording_url"))
+        }
+    
     def _summarize_content(self, content: Dict[str, Any]) -> str:
         """Helper method to create a short summary of content for dashboard display"""
         if not content:
             return "No content"
         
-        if "subject" in content:
-            return f"Email: {content.get('subject', '')}"
-        elif "recording_url" in content:
-            return "Call recording available"
-        elif "message" in content:
-            message = content.get("message", "")
-            if len(message) > 50:
-                return f"{message[:50]}..."
-            return message
+        for key, summarize in _SUMMARY_FNS.items():
+            if key in content:
+                return summarize(content)
         
         return "Content available"
     
@@ -258,7 +292,7 @@ class OutreachService:
             }
             
         except Exception as e:
-            logger.error(f"Error scheduling call: {str(e)}")
+            logger.error("Error scheduling call: %s", e)
             return None
     
     async def complete_call(self, call_data: outreach_schemas.CompleteCall, db=None) -> Dict[str, Any]:
@@ -276,7 +310,7 @@ class OutreachService:
             }
             
         except Exception as e:
-            logger.error(f"Error completing call: {str(e)}")
+            logger.error("Error completing call: %s", e)
             return None
     
     async def get_call_recording(self, call_id: str, db=None) -> Dict[str, Any]:
@@ -292,7 +326,7 @@ class OutreachService:
             }
             
         except Exception as e:
-            logger.error(f"Error getting call recording: {str(e)}")
+            logger.error("Error getting call recording: %s", e)
             return None
     
     async def get_call_transcript(self, call_id: str, db=None) -> Dict[str, Any]:
@@ -315,7 +349,7 @@ class OutreachService:
             }
             
         except Exception as e:
-            logger.error(f"Error getting call transcript: {str(e)}")
+            logger.error("Error getting call transcript: %s", e)
             return None
     
     async def create_outreach_entry(
@@ -337,7 +371,7 @@ class OutreachService:
                 twilio_call_sid=twilio_call_sid
             )
         except Exception as e:
-            logger.error(f"Error creating outreach entry: {str(e)}")
+            logger.error("Error creating outreach entry: %s", e)
             return None
     
     async def get_outreach_by_conversation_id(self, conversation_id: str) -> Optional[Dict[str, Any]]:
@@ -345,7 +379,7 @@ class OutreachService:
         try:
             return await SupabaseService.get_outreach_by_conversation_id(conversation_id)
         except Exception as e:
-            logger.error(f"Error getting outreach by conversation ID: {str(e)}")
+            logger.error("Error getting outreach by conversation ID: %s", e)
             return None
     
     async def update_from_elevenlabs_analysis(
@@ -360,23 +394,23 @@ class OutreachService:
                 analysis=analysis
             )
         except Exception as e:
-            logger.error(f"Error updating outreach from ElevenLabs analysis: {str(e)}")
+            logger.error("Error updating outreach from ElevenLabs analysis: %s", e)
             return None
     
     async def get_outreach_logs_by_campaign(self, campaign_id: str) -> List[Dict[str, Any]]:
-        """Get all outreach logs for a specific campaign"""
+        """Deprecated: use list_logs(campaign_id=...)"""
+        warnings.warn("get_outreach_logs_by_campaign is deprecated, use list_logs", DeprecationWarning, stacklevel=2)
         try:
-            return await SupabaseService.get_outreach_logs(campaign_id=campaign_id, limit=100)
-        except Exception as e:
-            logger.error(f"Error getting outreach logs by campaign: {str(e)}")
+            return await OutreachService.list_logs(campaign_id=campaign_id)
+        except HTTPException:
             return []
     
     async def get_outreach_logs_by_influencer(self, influencer_id: str) -> List[Dict[str, Any]]:
-        """Get all outreach logs for a specific influencer"""
+        """Deprecated: use list_logs(creator_id=...)"""
+        warnings.warn("get_outreach_logs_by_influencer is deprecated, use list_logs", DeprecationWarning, stacklevel=2)
         try:
-            return await SupabaseService.get_outreach_logs(creator_id=influencer_id, limit=100)
-        except Exception as e:
-            logger.error(f"Error getting outreach logs by influencer: {str(e)}")
+            return await OutreachService.list_logs(creator_id=influencer_id)
+        except HTTPException:
             return []
     
     @staticmethod
@@ -386,31 +420,17 @@ class OutreachService:
         automatically setting other required fields
         """
         try:
-            # Create a standard outreach with default values
-            outreach_data = outreach_schemas.OutreachCreate(
-                campaign_id=data.campaign_id,
-                creator_id=data.creator_id,
-                channel="initial",
-                message_type="outreach",
-                content={},
-                status="initialized"
-            )
+            # The database fills in the ID and default values in one insert
+            outreach_id = await SupabaseService.create_simple_outreach(data.campaign_id, data.creator_id)
             
-            # Convert to dict and add ID
-            outreach_dict = outreach_data.model_dump()
-            outreach_dict["id"] = str(uuid.uuid4())
-            
-            # Create the outreach log
-            log = await SupabaseService.create_outreach_log(outreach_dict)
-            
-            if not log:
+            if not outreach_id:
                 raise HTTPException(status_code=500, detail="Failed to create outreach")
             
             # Return just the ID for simplicity
-            return {"outreach_id": log["id"]}
+            return {"outreach_id": outreach_id}
             
         except Exception as e:
-            logger.error(f"Error creating simple outreach: {e}")
+            logger.error("Error creating simple outreach: %s", e)
             raise HTTPException(status_code=500, detail="Error creating outreach")
     
     @staticmethod
@@ -423,11 +443,6 @@ class OutreachService:
         Update an existing outreach record with call information
         """
         try:
-            # Check if outreach log exists
-            existing_log = await SupabaseService.get_outreach_log(outreach_id)
-            if not existing_log:
-                raise HTTPException(status_code=404, detail=f"Outreach log with ID {outreach_id} not found")
-            
             # Update the outreach log with call information
             update_data = {
                 "channel": "call",
@@ -435,18 +450,18 @@ class OutreachService:
                 "conversation_id": conversation_id,
                 "twilio_call_sid": twilio_call_sid,
                 "content": {
-                    "call_initiated_at": datetime.utcnow().isoformat(),
+                    "call_initiated_at": datetime.now(timezone.utc).isoformat(),
                     "call_status": "initiated"
                 }
             }
             
             updated_log = await SupabaseService.update_outreach_log(outreach_id, update_data)
             if not updated_log:
-                raise HTTPException(status_code=500, detail=f"Failed to update outreach log {outreach_id}")
+                raise HTTPException(status_code=404, detail=f"Outreach log with ID {outreach_id} not found")
             
             return updated_log
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"Error updating outreach log with call info {outreach_id}: {e}")
+            logger.error("Error updating outreach log with call info %s: %s", outreach_id, e)
             raise HTTPException(status_code=500, detail=f"Error updating outreach log with call info {outreach_id}") 
\ No newline at end of file
@@ -1,12 +1,10 @@
 import logging
 from typing import List, Dict, Any, Optional
 from uuid import UUID
-from sqlalchemy.orm import Session
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from fastapi import HTTPException
 import uuid
 
-from app.models.payment import Payment
 from app.schemas.payment import PaymentCreate, PaymentUpdate, PaymentProcess
 from app.services.supabase_service import SupabaseService
 
@@ -23,7 +21,8 @@ class PaymentService:
         skip: int = 0,
         limit: int = 100,
         contract_id: Optional[str] = None,
-        status: Optional[str] = None
+        status: Optional[str] = None,
+        cursor: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """
         Get all payments with optional filtering
@@ -33,10 +32,11 @@ class PaymentService:
                 skip=skip, 
                 limit=limit,
                 contract_id=contract_id,
-                status=status
+                status=status,
+                cursor=cursor
             )
         except Exception as e:
-            logger.error(f"Error getting payments: {e}")
+            logger.error("Error getting payments: %s", e)
             raise HTTPException(status_code=500, detail="Error retrieving payments")
     
     @staticmethod
@@ -52,7 +52,7 @@ class PaymentService:
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"Error getting payment {payment_id}: {e}")
+            logger.error("Error getting payment %s: %s", payment_id, e)
             raise HTTPException(status_code=500, detail=f"Error retrieving payment {payment_id}")
     
     @staticmethod
@@ -62,20 +62,23 @@ class PaymentService:
         """
         try:
             # Set default values
-            payment_dict = payment_data.model_dump()
-            payment_dict["id"] = str(uuid.uuid4())
-            payment_dict["status"] = "pending"
-            payment_dict["created_at"] = datetime.utcnow().isoformat()
-            payment_dict["updated_at"] = datetime.utcnow().isoformat()
+            now = datetime.now(timezone.utc).isoformat()
+            payment_dict = payment_data.model_dump(mode="json", exclude_none=True)
+            payment_dict.update(
+                id=str(uuid.uuid4()),
+                status="pending",
+                created_at=now,
+                updated_at=now
+            )
             
             # Create payment in database
-            payment = await SupabaseService.create_payment(PaymentCreate(**payment_dict))
+            payment = await SupabaseService.create_payment(payment_dict)
             if not payment:
                 raise HTTPException(status_code=500, detail="Failed to create payment")
             
             return payment
         except Exception as e:
-            logger.error(f"Error creating payment: {e}")
+            logger.error("Error creating payment: %s", e)
             raise HTTPException(status_code=500, detail="Error creating payment")
     
     @staticmethod
@@ -84,24 +87,19 @@ class PaymentService:
         Update an existing payment
         """
         try:
-            # Check if payment exists
-            existing_payment = await SupabaseService.get_payment(payment_id)
-            if not existing_payment:
-                raise HTTPException(status_code=404, detail=f"Payment with ID {payment_id} not found")
-            
-            # Update payment
             update_data = payment_data.model_dump(exclude_unset=True)
-            update_data["updated_at"] = datetime.utcnow().isoformat()
+            update_data["updated_at"] = datetime.now(timezone.utc).isoformat()
             
+            # The update returns the affected row, so no row means no such payment
             updated_payment = await SupabaseService.update_payment(payment_id, update_data)
             if not updated_payment:
-                raise HTTPException(status_code=500, detail=f"Failed to update payment {payment_id}")
+                raise HTTPException(status_code=404, detail=f"Payment with ID {payment_id} not found")
             
             return updated_payment
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"Error updating payment {payment_id}: {e}")
+            logger.error("Error updating payment %s: %s", payment_id, e)
             raise HTTPException(status_code=500, detail=f"Error updating payment {payment_id}")
     
     @staticmethod
@@ -114,34 +112,17 @@ class PaymentService:
         This would typically integrate with Stripe or another payment processor
         """
         try:
-            # Check if payment exists
-            existing_payment = await SupabaseService.get_payment(payment_id)
-            if not existing_payment:
+            # For now, simulate successful payment: method, transaction id and
+            # completed status are all set atomically by one RPC
+            final_payment = await SupabaseService.process_and_complete_payment(payment_id, payment_method)
+            if not final_payment:
                 raise HTTPException(status_code=404, detail=f"Payment with ID {payment_id} not found")
             
-            # Update payment status
-            payment_details = {
-                "payment_method": payment_method
-            }
-            
-            processed_payment = await SupabaseService.process_payment(payment_id, payment_details)
-            if not processed_payment:
-                raise HTTPException(status_code=500, detail=f"Failed to process payment {payment_id}")
-            
-            # For now, simulate successful payment
-            update_data = {
-                "status": "completed",
-                "payment_date": datetime.utcnow().isoformat(),
-                "updated_at": datetime.utcnow().isoformat()
-            }
-            
-            final_payment = await SupabaseService.update_payment(payment_id, update_data)
-            
             return final_payment
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"Error processing payment {payment_id}: {e}")
+            logger.error("Error processing payment %s: %s", payment_id, e)
             raise HTTPException(status_code=500, detail=f"Error processing payment {payment_id}")
     
     @staticmethod
@@ -152,7 +133,7 @@ class PaymentService:
         try:
             return await SupabaseService.get_payments(contract_id=contract_id, limit=1000)
         except Exception as e:
-            logger.error(f"Error getting payments for contract {contract_id}: {e}")
+            logger.error("Error getting payments for contract %s: %s", contract_id, e)
             raise HTTPException(status_code=500, detail=f"Error retrieving payments for contract {contract_id}")
             
     @staticmethod
@@ -161,27 +142,19 @@ class PaymentService:
         Get payment summary statistics
         """
         try:
-            # Get all payments
-            payments = await SupabaseService.get_payments(limit=1000)
+            # Aggregated in the database, one row with the summary fields
+            summary = await SupabaseService.get_payment_summary()
+            if summary is None:
+                raise HTTPException(status_code=500, detail="Error retrieving payment summary")
             
-            # Calculate summary statistics
-            total_payments = len(payments)
-            total_amount = sum(payment.get("amount", 0) for payment in payments)
-            pending_payments = len([p for p in payments if p.get("status") == "pending"])
-            completed_payments = len([p for p in payments if p.get("status") == "completed"])
-            
-            return {
-                "total_payments": total_payments,
-                "total_amount": total_amount,
-                "pending_payments": pending_payments,
-                "completed_payments": completed_payments,
-                "average_payment": total_amount / total_payments if total_payments > 0 else 0
-            }
+            return summary
+        except HTTPException:
+            raise
         except Exception as e:
-            logger.error(f"Error getting payment summary: {e}")
+            logger.error("Error getting payment summary: %s", e)
             raise HTTPException(status_code=500, detail="Error retrieving payment summary")
     
-    async def get_payment_dashboard(self, db: Session) -> Dict[str, Any]:
+    async def get_payment_dashboard(self) -> Dict[str, Any]:
         """
         Get payment dashboard summary
         """
@@ -221,7 +194,7 @@ class PaymentService:
             }
             
         except Exception as e:
-            logger.error(f"Error generating payment dashboard: {str(e)}")
+            logger.error("Error generating payment dashboard: %s", e)
             return {
                 "total_payments": {"amount": 0, "count": 0},
                 "pending_payments": {"amount": 0, "count": 0},
@@ -1,17 +1,211 @@
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Tuple, Union
 from app.core.supabase import supabase
+from postgrest.types import ReturnMethod
+from fastapi import HTTPException
+from app.services.cache import CacheService, DEFAULT_TTL
 from app.schemas import creator as creator_schemas
 from app.schemas import campaign as campaign_schemas
 from app.schemas import contract as contract_schemas
 from app.schemas import outreach as outreach_schemas
 from app.schemas import payment as payment_schemas
 from uuid import UUID
+import asyncio
+import base64
 import logging
 import datetime
 import uuid
+import httpx
+import numpy as np
+import os
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# Default columns for list queries. These leave out the bulky columns (creators.embedding_vector,
+# outreach_logs.full_transcript, contracts.terms); pass ``fields`` to select others.
+# Being constants, equivalent list requests produce identical select= strings
+CREATOR_LIST_COLS = (
+    "id,name,platform,niche,country,followers_count,followers_count_numeric,"
+    "engagement_rate,created_at"
+)
+OUTREACH_LOG_LIST_COLS = (
+    "id,campaign_id,creator_id,channel,message_type,status,content,"
+    "conversation_id,twilio_call_sid,call_duration_seconds,call_successful,transcript_summary,"
+    "interest_assessment_result,interest_assessment_rationale,"
+    "communication_quality_result,communication_quality_rationale,"
+    "interest_level,collaboration_rate,preferred_content_types,timeline_availability,"
+    "contact_preferences,audience_demographics,brand_restrictions,follow_up_actions,"
+    "last_contact_date,notes,sentiment,created_at,updated_at"
+)
+CONTRACT_LIST_COLS = (
+    "id,campaign_id,creator_id,payment_amount,payment_schedule,status,signed_at,"
+    "created_at,updated_at"
+)
+CAMPAIGN_LIST_COLS = (
+    "id,product_name,brand_name,product_description,target_audience,key_use_cases,"
+    "campaign_goal,product_niche,total_budget,status,influencer_count,campaign_code,"
+    "created_at,updated_at"
+)
+PAYMENT_LIST_COLS = (
+    "id,contract_id,amount,status,payment_method,transaction_id,due_date,paid_at,"
+    "created_at,updated_at"
+)
+
+
+# Network failures that the list getters log and answer with an empty page. PostgREST errors
+# (unknown column, bad filter) and query-construction errors propagate to the caller
+_TRANSIENT_ERRORS = (httpx.TransportError,)
+
+# Cap on in-flight Supabase requests per process, so a burst on one endpoint can't take
+# every connection in the pool
+SUPABASE_CONCURRENCY = int(os.getenv("SUPABASE_CONCURRENCY", "50"))
+# Created on first use: on Python 3.9 a semaphore binds to the loop current at construction
+_SEM: Optional[asyncio.Semaphore] = None
+
+
+async def _exec(query):
+    """
+    Execute a query builder on a worker thread (supabase-py's execute() is blocking)
+    while holding a slot of the Supabase concurrency limit
+    """
+    global _SEM
+    if _SEM is None:
+        _SEM = asyncio.Semaphore(SUPABASE_CONCURRENCY)
+    async with _SEM:
+        return await asyncio.to_thread(query.execute)
+
+
+def _first_row(response) -> Optional[Dict[str, Any]]:
+    """First row of a response, or None if there is none"""
+    if response is None:
+        # maybe_single() gives no response when no row matched
+        return None
+    data = response.data
+    if isinstance(data, list):
+        return data[0] if data else None
+    return data
+
+
+async def _one(action: str, query) -> Optional[Dict[str, Any]]:
+    """
+    Execute query and return its first row, or None if it matched nothing or failed
+    (action describes the query in the error log)
+    """
+    try:
+        response = await _exec(query)
+    except Exception:
+        logger.exception("Error %s in Supabase", action)
+        return None
+    return _first_row(response)
+
+
+async def _write(query) -> Optional[Dict[str, Any]]:
+    """
+    Execute a write or RPC and return its first row, or None if it matched nothing
+    Errors propagate, so callers can tell a missing row from a failed call
+    """
+    return _first_row(await _exec(query))
+
+
+async def _many(action: str, query) -> List[Dict[str, Any]]:
+    """Execute query and return its rows, or an empty list if it failed"""
+    try:
+        response = await _exec(query)
+    except Exception:
+        logger.exception("Error %s in Supabase", action)
+        return []
+    return response.data or []
+
+
+def _now_iso() -> str:
+    """Current UTC time as an ISO 8601 string"""
+    return datetime.datetime.now(datetime.timezone.utc).isoformat()
+
+
+def _dump(data: Any) -> Dict[str, Any]:
+    """
+    Insert payload for a Pydantic model or dict. Models are dumped JSON-ready, leaving out
+    unset and None fields so the database defaults apply
+    """
+    if hasattr(data, 'model_dump'):
+        return data.model_dump(mode="json", exclude_unset=True, exclude_none=True)
+    return data
+
+
+def next_cursor(rows: List[Dict[str, Any]], limit: int, order_column: str = "created_at") -> Optional[str]:
+    """
+    Opaque cursor for the page after rows, or None if rows was the last page
+    """
+    if len(rows) < limit:
+        return None
+    last = rows[-1]
+    return base64.urlsafe_b64encode(orjson.dumps([last[order_column], last["id"]])).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[Any, str]:
+    """Decode a cursor from next_cursor, raising ValueError if it is malformed"""
+    try:
+        after_value, after_id = orjson.loads(base64.urlsafe_b64decode(cursor))
+    except (TypeError, ValueError) as e:
+        # base64, JSON and unpacking errors are all ValueError or TypeError
+        raise ValueError("Malformed cursor") from e
+    if not isinstance(after_id, str) or not (after_value is None or isinstance(after_value, (str, int, float))):
+        raise ValueError("Malformed cursor")
+    return after_value, after_id
+
+
+def valid_cursor(cursor: Optional[str] = None) -> Optional[str]:
+    """Dependency for the cursor query parameter, rejecting malformed cursors with a 400"""
+    if cursor:
+        try:
+            _decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+    return cursor
+
+
+def _quote(value: Any) -> str:
+    """Double-quote a value for a PostgREST filter, escaping backslashes and quotes"""
+    return '"' + str(value).replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+def _apply_filters(query, filters: List[Tuple[Any, str, str]]):
+    """
+    Apply (value, column, operator) filters in order, skipping values that are None,
+    e.g. (min_followers, "followers_count_numeric", "gte")
+    """
+    for value, column, op in filters:
+        if value is not None:
+            query = getattr(query, op)(column, value)
+    return query
+
+
+def _page(query, order_column: str, skip: int, limit: int, cursor: Optional[str]):
+    """
+    Order newest first and apply pagination. With a cursor from next_cursor this is a
+    keyset filter on (order_column, id), otherwise it falls back to an offset.
+    """
+    query = query.order(order_column, desc=True).order("id", desc=True)
+    if cursor:
+        after_value, after_id = _decode_cursor(cursor)
+        after_id = _quote(after_id)
+        # Rows after the cursor in (order_column DESC, id DESC) order. Postgres sorts NULLs
+        # first for DESC, so a null key is followed by the rest of the nulls, then every non-null
+        if after_value is None:
+            query = query.or_(
+                f'and({order_column}.is.null,id.lt.{after_id}),'
+                f'{order_column}.not.is.null'
+            )
+        else:
+            after_value = _quote(after_value)
+            query = query.or_(
+                f'{order_column}.lt.{after_value},'
+                f'and({order_column}.eq.{after_value},id.lt.{after_id})'
+            )
+        return query.limit(limit)
+    return query.range(skip, skip + limit - 1)
+
+
 class SupabaseService:
     """Service for handling database operations with Supabase"""
     
@@ -24,34 +218,49 @@ class SupabaseService:
         country: Optional[str] = None,
         min_followers: Optional[int] = None,
         max_followers: Optional[int] = None,
-        min_engagement: Optional[float] = None
+        min_engagement: Optional[float] = None,
+        fields: Optional[str] = None,
+        cursor: Optional[str] = None
     ) -> List[Dict[str, Any]]:
-        """Get creators with optional filtering"""
+        """Get creators with optional filtering (``fields`` limits the selected columns), newest first"""
         try:
-            query = supabase.table("creators").select("*")
+            query = supabase.table("creators").select(fields or CREATOR_LIST_COLS)
             
             # Apply filters
-            if platform:
-                query = query.eq("platform", platform)
-            if niche:
-                query = query.eq("niche", niche)
-            if country:
-                query = query.eq("country", country)
-            if min_followers:
-                query = query.gte("followers_count_numeric", min_followers)
-            if max_followers:
-                query = query.lte("followers_count_numeric", max_followers)
-            if min_engagement:
-                query = query.gte("engagement_rate", min_engagement)
+            query = _apply_filters(query, [
+                (platform, "platform", "eq"),
+                (niche, "niche", "eq"),
+                (country, "country", "eq"),
+                (min_followers, "followers_count_numeric", "gte"),
+                (max_followers, "followers_count_numeric", "lte"),
+                (min_engagement, "engagement_rate", "gte"),
+            ])
             
             # Apply pagination
-            response = query.range(skip, skip + limit - 1).execute()
+            response = await _exec(_page(query, "created_at", skip, limit, cursor))
             
             return response.data
-        except Exception as e:
+        except _TRANSIENT_ERRORS as e:
             logger.error(f"Error fetching creators from Supabase: {e}")
             return []
     
+    @staticmethod
+    async def estimate_rows(table: str) -> Optional[int]:
+        """
+        Get the approximate row count of a table from planner statistics (cached for 60s)
+        Uses the database estimate_rows function instead of a COUNT(*) scan
+        """
+        async def fetch() -> Optional[int]:
+            response = await _exec(supabase.rpc('estimate_rows', {'table_name': table}))
+            return response.data
+        
+        return await CacheService.get_or_fetch(f"estimate_rows:{table}", 60, fetch)
+    
+    @staticmethod
+    async def get_creators_estimated_count() -> Optional[int]:
+        """Get the approximate number of creators"""
+        return await SupabaseService.estimate_rows("creators")
+    
     @staticmethod
     async def get_creators_with_embeddings(
         skip: int = 0,
@@ -64,149 +273,168 @@ class SupabaseService:
             query = supabase.table("creators").select("*").not_.is_("embedding_vector", "null")
             
             # Apply filters
-            if platform:
-                query = query.eq("platform", platform)
-            if niche:
-                query = query.eq("niche", niche)
+            query = _apply_filters(query, [
+                (platform, "platform", "eq"),
+                (niche, "niche", "eq"),
+            ])
             
             # Apply pagination
-            response = query.range(skip, skip + limit - 1).execute()
+            response = await _exec(query.range(skip, skip + limit - 1))
             
             return response.data
         except Exception as e:
             logger.error(f"Error fetching creators with embeddings from Supabase: {e}")
             return []
     
+    @staticmethod
+    async def get_creator_embeddings_matrix(
+        limit: int = 1000,
+        offset: int = 0
+    ) -> Tuple[List[str], np.ndarray]:
+        """
+        Get creator IDs and their embeddings as a (rows, dimensions) float32 matrix
+        Uses the database get_creator_embeddings_binary function, which sends each vector as packed bytes
+        """
+        response = await _exec(supabase.rpc(
+            'get_creator_embeddings_binary',
+            {
+                'p_limit': limit,
+                'p_offset': offset
+            }
+        ))
+        rows = response.data or []
+        if not rows:
+            return [], np.empty((0, 0), dtype=np.float32)
+        
+        ids = [row["id"] for row in rows]
+        packed = b"".join(base64.b64decode(row["emb"]) for row in rows)
+        matrix = np.frombuffer(packed, dtype=">f4").astype(np.float32).reshape(len(rows), -1)
+        return ids, matrix
+    
     @staticmethod
     async def get_creator(creator_id: str) -> Optional[Dict[str, Any]]:
         """Get a creator by ID"""
-        try:
-            response = supabase.table("creators").select("*").eq("id", creator_id).execute()
-            if response.data and len(response.data) > 0:
-                return response.data[0]
-            return None
-        except Exception as e:
-            logger.error(f"Error fetching creator {creator_id} from Supabase: {e}")
-            return None
+        async def fetch() -> Optional[Dict[str, Any]]:
+            return await _one(f"fetching creator {creator_id}", supabase.table("creators").select("*").eq("id", creator_id).maybe_single())
+        
+        return await CacheService.get_or_fetch(f"creator:{creator_id}", DEFAULT_TTL, fetch)
+    
+    @staticmethod
+    async def get_creators_by_ids(
+        creator_ids: List[str],
+        fields: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Get several creators by ID in a single query (``fields`` defaults to the list columns)"""
+        if not creator_ids:
+            return []
+        return await _many(f"fetching creators {creator_ids}", supabase.table("creators").select(fields or CREATOR_LIST_COLS).in_("id", creator_ids))
     
     @staticmethod
     async def create_creator(creator_data: creator_schemas.CreatorCreate) -> Optional[Dict[str, Any]]:
         """Create a new creator"""
-        try:
-            response = supabase.table("creators").insert(creator_data.model_dump()).execute()
-            if response.data and len(response.data) > 0:
-                return response.data[0]
-            return None
-        except Exception as e:
-            logger.error(f"Error creating creator in Supabase: {e}")
-            return None
+        return await _write(supabase.table("creators").insert(_dump(creator_data)))
+    
+    @staticmethod
+    async def create_creators_bulk(
+        rows: List[Union[Dict[str, Any], creator_schemas.CreatorCreate]],
+        return_rows: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Create several creators with a single insert
+        Unless return_rows is set the inserted rows are not sent back and an empty list is returned
+        """
+        data = [_dump(row) for row in rows]
+        if not data:
+            return []
+        if return_rows:
+            response = await _exec(supabase.table("creators").insert(data))
+            return response.data or []
+        await _exec(supabase.table("creators").insert(data, returning=ReturnMethod.minimal))
+        return []
     
     @staticmethod
     async def update_creator(creator_id: str, creator_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Update a creator"""
         try:
-            response = supabase.table("creators").update(creator_data).eq("id", creator_id).execute()
-            if response.data and len(response.data) > 0:
-                return response.data[0]
-            return None
-        except Exception as e:
-            logger.error(f"Error updating creator {creator_id} in Supabase: {e}")
-            return None
+            return await _write(supabase.table("creators").update(creator_data).eq("id", creator_id))
+        finally:
+            await CacheService.invalidate(f"creator:{creator_id}")
     
     @staticmethod
     async def update_creator_embedding(creator_id: str, embedding_vector: List[float]) -> bool:
         """Update a creator's embedding vector"""
         try:
-            response = supabase.table("creators").update({
+            response = await _exec(supabase.table("creators").update({
                 "embedding_vector": embedding_vector,
-                "updated_at": datetime.datetime.utcnow().isoformat()
-            }).eq("id", creator_id).execute()
-            
-            return len(response.data) > 0
-        except Exception as e:
-            logger.error(f"Error updating embedding for creator {creator_id}: {e}")
-            return False
+                "updated_at": _now_iso()
+            }).eq("id", creator_id))
+        finally:
+            await CacheService.invalidate(f"creator:{creator_id}")
+        
+        return len(response.data) > 0
     
     @staticmethod
     async def delete_creator(creator_id: str) -> bool:
         """Delete a creator"""
         try:
-            response = supabase.table("creators").delete().eq("id", creator_id).execute()
-            return True
-        except Exception as e:
-            logger.error(f"Error deleting creator {creator_id} from Supabase: {e}")
-            return False
+            await _exec(supabase.table("creators").delete().eq("id", creator_id))
+        finally:
+            await CacheService.invalidate(f"creator:{creator_id}")
+        return True
 
     @staticmethod
     async def get_campaigns(
         skip: int = 0,
         limit: int = 100,
-        status: Optional[str] = None
+        status: Optional[str] = None,
+        fields: Optional[str] = None,
+        cursor: Optional[str] = None
     ) -> List[Dict[str, Any]]:
-        """Get campaigns with optional filtering"""
+        """Get campaigns with optional filtering (``fields`` limits the selected columns), newest first"""
         try:
-            query = supabase.table("campaigns").select("*")
+            query = supabase.table("campaigns").select(fields or CAMPAIGN_LIST_COLS)
             
             # Apply filters
             if status:
                 query = query.eq("status", status)
             
             # Apply pagination
-            response = query.range(skip, skip + limit - 1).execute()
+            response = await _exec(_page(query, "created_at", skip, limit, cursor))
             
             return response.data
-        except Exception as e:
+        except _TRANSIENT_ERRORS as e:
             logger.error(f"Error fetching campaigns from Supabase: {e}")
             return []
     
     @staticmethod
     async def get_campaign(campaign_id: str) -> Optional[Dict[str, Any]]:
         """Get a campaign by ID"""
-        try:
-            response = supabase.table("campaigns").select("*").eq("id", campaign_id).execute()
-            if response.data and len(response.data) > 0:
-                return response.data[0]
-            return None
-        except Exception as e:
-            logger.error(f"Error fetching campaign {campaign_id} from Supabase: {e}")
-            return None
+        async def fetch() -> Optional[Dict[str, Any]]:
+            return await _one(f"fetching campaign {campaign_id}", supabase.table("campaigns").select("*").eq("id", campaign_id).maybe_single())
+        
+        return await CacheService.get_or_fetch(f"campaign:{campaign_id}", DEFAULT_TTL, fetch)
     
     @staticmethod
     async def create_campaign(campaign_data: Union[Dict[str, Any], campaign_schemas.CampaignCreate]) -> Optional[Dict[str, Any]]:
         """Create a new campaign"""
-        try:
-            # Convert to dict if it's a Pydantic model
-            data_dict = campaign_data.model_dump() if hasattr(campaign_data, 'model_dump') else campaign_data
-            
-            response = supabase.table("campaigns").insert(data_dict).execute()
-            if response.data and len(response.data) > 0:
-                return response.data[0]
-            return None
-        except Exception as e:
-            logger.error(f"Error creating campaign in Supabase: {e}")
-            return None
+        return await _write(supabase.table("campaigns").insert(_dump(campaign_data)))
     
     @staticmethod
     async def update_campaign(campaign_id: str, campaign_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Update a campaign"""
         try:
-            response = supabase.table("campaigns").update(campaign_data).eq("id", campaign_id).execute()
-            if response.data and len(response.data) > 0:
-                return response.data[0]
-            return None
-        except Exception as e:
-            logger.error(f"Error updating campaign {campaign_id} in Supabase: {e}")
-            return None
+            return await _write(supabase.table("campaigns").update(campaign_data).eq("id", campaign_id))
+        finally:
+            await CacheService.invalidate(f"campaign:{campaign_id}")
     
     @staticmethod
     async def delete_campaign(campaign_id: str) -> bool:
         """Delete a campaign"""
         try:
-            response = supabase.table("campaigns").delete().eq("id", campaign_id).execute()
-            return True
-        except Exception as e:
-            logger.error(f"Error deleting campaign {campaign_id} from Supabase: {e}")
-            return False
+            await _exec(supabase.table("campaigns").delete().eq("id", campaign_id))
+        finally:
+            await CacheService.invalidate(f"campaign:{campaign_id}")
+        return True
 
     @staticmethod
     async def get_contracts(
@@ -214,208 +442,212 @@ class SupabaseService:
         limit: int = 100,
         campaign_id: Optional[str] = None,
         creator_id: Optional[str] = None,
-        status: Optional[str] = None
+        status: Optional[str] = None,
+        fields: Optional[str] = None,
+        cursor: Optional[str] = None
     ) -> List[Dict[str, Any]]:
-        """Get contracts with optional filtering"""
+        """Get contracts with optional filtering (``fields`` limits the selected columns), newest first"""
         try:
-            query = supabase.table("contracts").select("*")
+            query = supabase.table("contracts").select(fields or CONTRACT_LIST_COLS)
             
             # Apply filters
-            if campaign_id:
-                query = query.eq("campaign_id", campaign_id)
-            if creator_id:
-                query = query.eq("creator_id", creator_id)
-            if status:
-                query = query.eq("status", status)
+            query = _apply_filters(query, [
+                (campaign_id, "campaign_id", "eq"),
+                (creator_id, "creator_id", "eq"),
+                (status, "status", "eq"),
+            ])
             
             # Apply pagination
-            response = query.range(skip, skip + limit - 1).execute()
+            response = await _exec(_page(query, "created_at", skip, limit, cursor))
             
             return response.data
-        except Exception as e:
+        except _TRANSIENT_ERRORS as e:
             logger.error(f"Error fetching contracts from Supabase: {e}")
             return []
     
     @staticmethod
     async def get_contract(contract_id: str) -> Optional[Dict[str, Any]]:
         """Get a contract by ID"""
-        try:
-            response = supabase.table("contracts").select("*").eq("id", contract_id).execute()
-            if response.data and len(response.data) > 0:
-                return response.data[0]
-            return None
-        except Exception as e:
-            logger.error(f"Error fetching contract {contract_id} from Supabase: {e}")
-            return None
+        async def fetch() -> Optional[Dict[str, Any]]:
+            return await _one(f"fetching contract {contract_id}", supabase.table("contracts").select("*").eq("id", contract_id).maybe_single())
+        
+        return await CacheService.get_or_fetch(f"contract:{contract_id}", DEFAULT_TTL, fetch)
     
     @staticmethod
-    async def create_contract(contract_data: contract_schemas.ContractCreate) -> Optional[Dict[str, Any]]:
+    async def create_contract(contract_data: Union[Dict[str, Any], contract_schemas.ContractCreate]) -> Optional[Dict[str, Any]]:
         """Create a new contract"""
-        try:
-            response = supabase.table("contracts").insert(contract_data.model_dump()).execute()
-            if response.data and len(response.data) > 0:
-                return response.data[0]
-            return None
-        except Exception as e:
-            logger.error(f"Error creating contract in Supabase: {e}")
-            return None
+        return await _write(supabase.table("contracts").insert(_dump(contract_data)))
     
     @staticmethod
     async def update_contract(contract_id: str, contract_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Update a contract"""
         try:
-            response = supabase.table("contracts").update(contract_data).eq("id", contract_id).execute()
-            if response.data and len(response.data) > 0:
-                return response.data[0]
-            return None
-        except Exception as e:
-            logger.error(f"Error updating contract {contract_id} in Supabase: {e}")
-            return None
+            return await _write(supabase.table("contracts").update(contract_data).eq("id", contract_id))
+        finally:
+            await CacheService.invalidate(f"contract:{contract_id}")
 
     @staticmethod
     async def get_outreach_logs(
         skip: int = 0,
         limit: int = 100,
         campaign_id: Optional[str] = None,
-        creator_id: Optional[str] = None
+        creator_id: Optional[str] = None,
+        cursor: Optional[str] = None,
+        fields: Optional[str] = None
     ) -> List[Dict[str, Any]]:
-        """Get outreach logs with optional filtering"""
+        """Get outreach logs with optional filtering (``fields`` limits the selected columns), newest first"""
         try:
-            query = supabase.table("outreach_logs").select("*")
+            query = supabase.table("outreach_logs").select(fields or OUTREACH_LOG_LIST_COLS)
             
             # Apply filters
-            if campaign_id:
-                query = query.eq("campaign_id", campaign_id)
-            if creator_id:
-                query = query.eq("creator_id", creator_id)
+            query = _apply_filters(query, [
+                (campaign_id, "campaign_id", "eq"),
+                (creator_id, "creator_id", "eq"),
+            ])
             
             # Apply pagination
-            response = query.range(skip, skip + limit - 1).execute()
+            response = await _exec(_page(query, "created_at", skip, limit, cursor))
             
             return response.data
-        except Exception as e:
+        except _TRANSIENT_ERRORS as e:
             logger.error(f"Error fetching outreach logs from Supabase: {e}")
             return []
     
+    @staticmethod
+    async def get_outreach_summary(campaign_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get pre-aggregated outreach counts per campaign from the dashboard summary view"""
+        query = supabase.table("outreach_dashboard_summary").select("*")
+        if campaign_id:
+            query = query.eq("campaign_id", campaign_id)
+        response = await _exec(query)
+        return response.data or []
+    
     @staticmethod
     async def get_outreach_log(log_id: str) -> Optional[Dict[str, Any]]:
         """Get an outreach log by ID"""
-        try:
-            response = supabase.table("outreach_logs").select("*").eq("id", log_id).execute()
-            if response.data and len(response.data) > 0:
-                return response.data[0]
-            return None
-        except Exception as e:
-            logger.error(f"Error fetching outreach log {log_id} from Supabase: {e}")
-            return None
+        async def fetch() -> Optional[Dict[str, Any]]:
+            return await _one(f"fetching outreach log {log_id}", supabase.table("outreach_logs").select("*").eq("id", log_id).maybe_single())
+        
+        return await CacheService.get_or_fetch(f"outreach_log:{log_id}", DEFAULT_TTL, fetch)
     
     @staticmethod
     async def create_outreach_log(log_data: Union[Dict[str, Any], outreach_schemas.OutreachCreate]) -> Optional[Dict[str, Any]]:
         """Create a new outreach log"""
-        try:
-            # Convert to dict if it's a Pydantic model
-            data_dict = log_data.model_dump() if hasattr(log_data, 'model_dump') else log_data
-            
-            response = supabase.table("outreach_logs").insert(data_dict).execute()
-            if response.data and len(response.data) > 0:
-                return response.data[0]
-            return None
-        except Exception as e:
-            logger.error(f"Error creating outreach log in Supabase: {e}")
-            return None
+        return await _write(supabase.table("outreach_logs").insert(_dump(log_data)))
+    
+    @staticmethod
+    async def create_simple_outreach(campaign_id: str, creator_id: str) -> Optional[str]:
+        """
+        Create an outreach log with default values and return its ID
+        Uses the database create_simple_outreach function
+        """
+        response = await _exec(supabase.rpc(
+            'create_simple_outreach',
+            {
+                'p_campaign': campaign_id,
+                'p_creator': creator_id
+            }
+        ))
+        return response.data or None
     
     @staticmethod
     async def update_outreach_log(log_id: str, log_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Update an outreach log"""
         try:
-            response = supabase.table("outreach_logs").update(log_data).eq("id", log_id).execute()
-            if response.data and len(response.data) > 0:
-                return response.data[0]
-            return None
-        except Exception as e:
-            logger.error(f"Error updating outreach log {log_id} in Supabase: {e}")
-            return None
+            row = await _write(supabase.table("outreach_logs").update(log_data).eq("id", log_id))
+        finally:
+            await CacheService.invalidate(f"outreach_log:{log_id}")
+        if row and (conversation_id := row.get("conversation_id")):
+            await CacheService.invalidate(f"outreach_conversation:{conversation_id}")
+        return row
 
     @staticmethod
     async def get_payments(
         skip: int = 0,
         limit: int = 100,
         contract_id: Optional[str] = None,
-        status: Optional[str] = None
+        status: Optional[str] = None,
+        cursor: Optional[str] = None
     ) -> List[Dict[str, Any]]:
-        """Get payments with optional filtering"""
+        """Get payments with optional filtering, newest first"""
         try:
-            query = supabase.table("payments").select("*")
+            query = supabase.table("payments").select(PAYMENT_LIST_COLS)
             
             # Apply filters
-            if contract_id:
-                query = query.eq("contract_id", contract_id)
-            if status:
-                query = query.eq("status", status)
+            query = _apply_filters(query, [
+                (contract_id, "contract_id", "eq"),
+                (status, "status", "eq"),
+            ])
             
             # Apply pagination
-            response = query.range(skip, skip + limit - 1).execute()
+            response = await _exec(_page(query, "created_at", skip, limit, cursor))
             
             return response.data
-        except Exception as e:
+        except _TRANSIENT_ERRORS as e:
             logger.error(f"Error fetching payments from Supabase: {e}")
             return []
     
     @staticmethod
     async def get_payment(payment_id: str) -> Optional[Dict[str, Any]]:
         """Get a payment by ID"""
-        try:
-            response = supabase.table("payments").select("*").eq("id", payment_id).execute()
-            if response.data and len(response.data) > 0:
-                return response.data[0]
-            return None
-        except Exception as e:
-            logger.error(f"Error fetching payment {payment_id} from Supabase: {e}")
-            return None
+        async def fetch() -> Optional[Dict[str, Any]]:
+            return await _one(f"fetching payment {payment_id}", supabase.table("payments").select("*").eq("id", payment_id).maybe_single())
+        
+        return await CacheService.get_or_fetch(f"payment:{payment_id}", DEFAULT_TTL, fetch)
     
     @staticmethod
-    async def create_payment(payment_data: payment_schemas.PaymentCreate) -> Optional[Dict[str, Any]]:
+    async def create_payment(payment_data: Union[Dict[str, Any], payment_schemas.PaymentCreate]) -> Optional[Dict[str, Any]]:
         """Create a new payment"""
-        try:
-            response = supabase.table("payments").insert(payment_data.model_dump()).execute()
-            if response.data and len(response.data) > 0:
-                return response.data[0]
-            return None
-        except Exception as e:
-            logger.error(f"Error creating payment in Supabase: {e}")
-            return None
+        return await _write(supabase.table("payments").insert(_dump(payment_data)))
     
     @staticmethod
     async def update_payment(payment_id: str, payment_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Update a payment"""
         try:
-            response = supabase.table("payments").update(payment_data).eq("id", payment_id).execute()
-            if response.data and len(response.data) > 0:
-                return response.data[0]
-            return None
-        except Exception as e:
-            logger.error(f"Error updating payment {payment_id} in Supabase: {e}")
-            return None
+            return await _write(supabase.table("payments").update(payment_data).eq("id", payment_id))
+        finally:
+            await CacheService.invalidate(f"payment:{payment_id}")
     
     @staticmethod
     async def process_payment(payment_id: str, payment_details: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Process a payment (mock implementation)"""
+        # Update payment status
+        payment_data = {
+            "status": "processing",
+            "transaction_id": f"txn_mock_{uuid.uuid4().hex[:8]}",
+            "payment_method": payment_details.get("payment_method", "card"),
+            "updated_at": _now_iso()
+        }
+        
         try:
-            # Update payment status
-            payment_data = {
-                "status": "processing",
-                "transaction_id": f"txn_mock_{uuid.uuid4().hex[:8]}",
-                "payment_method": payment_details.get("payment_method", "card"),
-                "updated_at": datetime.datetime.utcnow().isoformat()
-            }
-            
-            response = supabase.table("payments").update(payment_data).eq("id", payment_id).execute()
-            if response.data and len(response.data) > 0:
-                return response.data[0]
-            return None
-        except Exception as e:
-            logger.error(f"Error processing payment {payment_id} in Supabase: {e}")
-            return None
+            return await _write(supabase.table("payments").update(payment_data).eq("id", payment_id))
+        finally:
+            await CacheService.invalidate(f"payment:{payment_id}")
+
+    @staticmethod
+    async def get_payment_summary() -> Optional[Dict[str, Any]]:
+        """
+        Get payment summary statistics
+        Uses the database payment_summary function to aggregate in a single row
+        """
+        return await _write(supabase.rpc('payment_summary', {}))
+    
+    @staticmethod
+    async def process_and_complete_payment(payment_id: str, payment_method: str) -> Optional[Dict[str, Any]]:
+        """
+        Process and complete a payment in one round trip (mock implementation)
+        Uses the database process_and_complete_payment function
+        """
+        try:
+            return await _write(supabase.rpc(
+                'process_and_complete_payment',
+                {
+                    'p_payment_id': payment_id,
+                    'p_payment_method': payment_method
+                }
+            ))
+        finally:
+            await CacheService.invalidate(f"payment:{payment_id}")
 
     @staticmethod
     async def match_creators_by_embedding(
@@ -437,14 +669,14 @@ class SupabaseService:
         """
         try:
             # Call the RPC function in the database
-            response = supabase.rpc(
+            response = await _exec(supabase.rpc(
                 'match_creators',
                 {
                     'query_embedding': embedding_vector,
                     'match_threshold': match_threshold,
                     'match_count': match_count
                 }
-            ).execute()
+            ))
             
             if not response.data:
                 return []
@@ -454,6 +686,40 @@ class SupabaseService:
             logger.error(f"Error performing similarity search: {e}")
             return []
 
+    @staticmethod
+    async def match_creators_batch(
+        embedding_vectors: List[List[float]],
+        match_threshold: float = 0.5,
+        match_count: int = 10
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Find matching creators for several embedding vectors in a single RPC
+        Uses the database match_creators_batch function
+        
+        Args:
+            embedding_vectors: The query embedding vectors to match against
+            match_threshold: Minimum similarity score (0-1) to include in results
+            match_count: Maximum number of results to return per query
+            
+        Returns:
+            One list of creator records with similarity scores per input vector, in input order
+        """
+        matches: List[List[Dict[str, Any]]] = [[] for _ in embedding_vectors]
+        if not embedding_vectors:
+            return matches
+        response = await _exec(supabase.rpc(
+            'match_creators_batch',
+            {
+                'query_embeddings': [orjson.dumps(vector).decode() for vector in embedding_vectors],
+                'match_threshold': match_threshold,
+                'match_count': match_count
+            }
+        ))
+        
+        for row in response.data or []:
+            matches[row.pop('query_idx')].append(row)
+        return matches
+
     @staticmethod
     async def create_outreach_elevenlabs_entry(
         campaign_id: str,
@@ -463,134 +729,62 @@ class SupabaseService:
         status: str = "initiated"
     ) -> Dict[str, Any]:
         """Create a new outreach entry for ElevenLabs call"""
-        try:
-            data = {
-                "id": str(uuid.uuid4()),
-                "campaign_id": campaign_id,
-                "influencer_id": influencer_id,
-                "channel": "call",
-                "message_type": "outreach",
-                "status": status,
-                "conversation_id": conversation_id,
-                "twilio_call_sid": twilio_call_sid,
-                "last_contact_date": datetime.now().isoformat(),
-                "created_at": datetime.now().isoformat(),
-                "updated_at": datetime.now().isoformat()
-            }
-            
-            result = supabase.table("outreach_logs").insert(data).execute()
-            
-            if result.data and len(result.data) > 0:
-                return result.data[0]
-            
-            return None
-        except Exception as e:
-            logger.error(f"Error creating outreach entry: {str(e)}")
-            return None
+        now = _now_iso()
+        data = {
+            "id": str(uuid.uuid4()),
+            "campaign_id": campaign_id,
+            "influencer_id": influencer_id,
+            "channel": "call",
+            "message_type": "outreach",
+            "status": status,
+            "conversation_id": conversation_id,
+            "twilio_call_sid": twilio_call_sid,
+            "last_contact_date": now,
+            "created_at": now,
+            "updated_at": now
+        }
+        
+        return await _write(supabase.table("outreach_logs").insert(data))
     
     @staticmethod
     async def get_outreach_by_conversation_id(conversation_id: str) -> Optional[Dict[str, Any]]:
         """Get outreach log by ElevenLabs conversation ID"""
-        try:
-            result = supabase.table("outreach_logs") \
-                .select("*") \
-                .eq("conversation_id", conversation_id) \
-                .execute()
-            
-            if result.data and len(result.data) > 0:
-                return result.data[0]
-            
-            return None
-        except Exception as e:
-            logger.error(f"Error getting outreach by conversation ID: {str(e)}")
-            return None
+        async def fetch() -> Optional[Dict[str, Any]]:
+            return await _one(
+                f"getting outreach by conversation ID {conversation_id}",
+                supabase.table("outreach_logs")
+                .select("*")
+                .eq("conversation_id", conversation_id)
+                .limit(1)
+                .maybe_single()
+            )
+        
+        return await CacheService.get_or_fetch(f"outreach_conversation:{conversation_id}", DEFAULT_TTL, fetch)
     
     @staticmethod
     async def update_outreach_from_elevenlabs_analysis(
         conversation_id: str,
         analysis: Dict[str, Any]
     ) -> Optional[Dict[str, Any]]:
-        """Update outreach log with ElevenLabs conversation analysis"""
+        """
+        Update outreach log with ElevenLabs conversation analysis
+        Uses the database upsert_outreach_from_raw_analysis function, which extracts the fields
+        from the analysis JSON and updates the row found by conversation ID in one call
+        """
         try:
-            # Get the outreach log
-            outreach = await SupabaseService.get_outreach_by_conversation_id(conversation_id)
-            
-            if not outreach:
-                logger.warning(f"No outreach log found for conversation ID: {conversation_id}")
-                return None
-            
-            # Prepare update data
-            update_data = {
-                "status": "completed" if analysis["status"] == "done" else analysis["status"],
-                "call_duration_seconds": analysis["metadata"]["duration_seconds"],
-                "call_successful": analysis["analysis"]["call_successful"],
-                "transcript_summary": analysis["analysis"]["transcript_summary"],
-                "full_transcript": analysis["transcript"],
-                "updated_at": datetime.now().isoformat()
-            }
-            
-            # Extract evaluation criteria results
-            if "evaluation_criteria_results" in analysis["analysis"]:
-                eval_results = analysis["analysis"]["evaluation_criteria_results"]
-                
-                if "collaboration_interest_assessment" in eval_results:
-                    update_data["interest_assessment_result"] = eval_results["collaboration_interest_assessment"]["result"]
-                    update_data["interest_assessment_rationale"] = eval_results["collaboration_interest_assessment"]["rationale"]
-                
-                if "professional_communication_quality" in eval_results:
-                    update_data["communication_quality_result"] = eval_results["professional_communication_quality"]["result"]
-                    update_data["communication_quality_rationale"] = eval_results["professional_communication_quality"]["rationale"]
-            
-            # Extract data collection results
-            if "data_collection_results" in analysis["analysis"]:
-                data_results = analysis["analysis"]["data_collection_results"]
-                
-                if "interest_level" in data_results:
-                    update_data["interest_level"] = data_results["interest_level"]["value"]
-                
-                if "collaboration_rate" in data_results:
-                    update_data["collaboration_rate"] = data_results["collaboration_rate"]["value"]
-                
-                if "preferred_content_types" in data_results:
-                    update_data["preferred_content_types"] = data_results["preferred_content_types"]["value"]
-                
-                if "timeline_availability" in data_results:
-                    update_data["timeline_availability"] = data_results["timeline_availability"]["value"]
-                
-                if "contact_preferences" in data_results:
-                    update_data["contact_preferences"] = data_results["contact_preferences"]["value"]
-                
-                if "audience_demographics" in data_results:
-                    update_data["audience_demographics"] = data_results["audience_demographics"]["value"]
-                
-                if "brand_restrictions" in data_results:
-                    update_data["brand_restrictions"] = data_results["brand_restrictions"]["value"]
-                
-                if "follow_up_actions" in data_results:
-                    update_data["follow_up_actions"] = data_results["follow_up_actions"]["value"]
-            
-            # Determine sentiment based on interest level
-            if "interest_level" in update_data:
-                interest = update_data["interest_level"]
-                if interest == "very_interested":
-                    update_data["sentiment"] = "positive"
-                elif interest == "interested":
-                    update_data["sentiment"] = "neutral_positive"
-                elif interest == "neutral":
-                    update_data["sentiment"] = "neutral"
-                else:
-                    update_data["sentiment"] = "neutral_negative"
-            
-            # Update the record in Supabase
-            result = supabase.table("outreach_logs") \
-                .update(update_data) \
-                .eq("id", outreach["id"]) \
-                .execute()
-            
-            if result.data and len(result.data) > 0:
-                return result.data[0]
-            
+            row = await _write(supabase.rpc(
+                'upsert_outreach_from_raw_analysis',
+                {
+                    'p_conversation_id': conversation_id,
+                    'p_analysis': analysis
+                }
+            ))
+        finally:
+            await CacheService.invalidate(f"outreach_conversation:{conversation_id}")
+        
+        if row is None:
+            logger.warning(f"No outreach log found for conversation ID: {conversation_id}")
             return None
-        except Exception as e:
-            logger.error(f"Error updating outreach from ElevenLabs analysis: {str(e)}")
-            return None 
\ No newline at end of file
+        
+        await CacheService.invalidate(f"outreach_log:{row['id']}")
+        return row 
\ No newline at end of file
@@ -0,0 +1,27 @@
+import os
+import uuid
+from collections import deque
+
+# Number of UUIDs generated per os.urandom call
+_POOL_SIZE = 256
+
+_uuid_pool: deque = deque()
+
+
+def _refill_pool() -> None:
+    """Generate a batch of random UUIDs from a single urandom read"""
+    raw = os.urandom(16 * _POOL_SIZE)
+    _uuid_pool.extend(
+        str(uuid.UUID(bytes=raw[i:i + 16], version=4)) for i in range(0, len(raw), 16)
+    )
+
+
+def next_uuid() -> str:
+    """
+    Return a random (version 4) UUID string, drawn from a pre-generated pool
+    """
+    try:
+        return _uuid_pool.popleft()
+    except IndexError:
+        _refill_pool()
+        return _uuid_pool.popleft()
@@ -19,12 +19,22 @@ def main():
     print(f"Starting InfluencerFlow API in {env} environment")
     print(f"Running on http://{host}:{port}")
     
+    # Production runs several workers behind the platform's proxy; reload needs a single process
+    production_options = {
+        "workers": int(os.environ.get("WORKERS", "1")),
+        "proxy_headers": True,
+        "forwarded_allow_ips": "*",
+    } if env == "production" else {}
+    
     uvicorn.run(
         "app.main:app",
         host=host,
         port=port,
         reload=reload_mode,
-        log_level="info"
+        loop="uvloop",
+        http="httptools",
+        log_level="info",
+        **production_options
     )
 
 if __name__ == "__main__":
@@ -0,0 +1,7 @@
+import os
+
+# app.core creates its database engine and Supabase client at import time. Point them at
+# placeholders so the modules import without credentials; none of these tests connect
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SUPABASE_URL", "http://localhost:54321")
+os.environ.setdefault("SUPABASE_KEY", "test.test.test")
@@ -0,0 +1,111 @@
+import asyncio
+
+from app.services.conversation_manager_backup import (
+    ConversationManager,
+    ConversationStatus,
+    MessageRole,
+)
+
+
+def _create(manager: ConversationManager) -> str:
+    return manager.create_conversation(
+        campaign_brief={"deliverables": ["1 reel"], "timeline": "2 weeks"},
+        creator_profile={"typical_rate": 1000},
+        initial_strategy={"opening_price": 500},
+    )
+
+
+def test_writes_are_buffered_until_a_read_flushes():
+    async def scenario():
+        manager = ConversationManager(batch_size=100, max_wait=60)
+        conversation_id = _create(manager)
+        
+        for content in ("one", "two", "three"):
+            assert manager.add_message(conversation_id, MessageRole.CREATOR, content)
+        assert manager.messages[conversation_id] == []
+        
+        messages = manager.get_messages(conversation_id)
+        assert [m.content for m in messages] == ["one", "two", "three"]
+        # One timestamp covers the whole batch
+        assert len({m.timestamp for m in messages}) == 1
+        assert manager.conversations[conversation_id].message_count == 3
+    
+    asyncio.run(scenario())
+
+
+def test_full_batch_is_applied_immediately():
+    async def scenario():
+        manager = ConversationManager(batch_size=2, max_wait=60)
+        conversation_id = _create(manager)
+        
+        manager.add_message(conversation_id, MessageRole.CREATOR, "one")
+        manager.add_message(conversation_id, MessageRole.AGENCY, "two")
+        assert [m.content for m in manager.messages[conversation_id]] == ["one", "two"]
+    
+    asyncio.run(scenario())
+
+
+def test_pending_writes_are_flushed_after_max_wait():
+    async def scenario():
+        manager = ConversationManager(batch_size=100, max_wait=0.01)
+        conversation_id = _create(manager)
+        
+        manager.add_message(conversation_id, MessageRole.CREATOR, "one")
+        await asyncio.sleep(0.05)
+        assert [m.content for m in manager.messages[conversation_id]] == ["one"]
+    
+    asyncio.run(scenario())
+
+
+def test_writes_without_an_event_loop_apply_immediately():
+    manager = ConversationManager()
+    conversation_id = _create(manager)
+    
+    manager.add_message(conversation_id, MessageRole.CREATOR, "one")
+    assert [m.content for m in manager.messages[conversation_id]] == ["one"]
+
+
+def test_flush_keeps_event_order_across_kinds():
+    async def scenario():
+        manager = ConversationManager(batch_size=100, max_wait=60)
+        conversation_id = _create(manager)
+        
+        manager.add_message(conversation_id, MessageRole.CREATOR, "hello")
+        manager.update_conversation_status(conversation_id, ConversationStatus.NEGOTIATING)
+        manager.add_message(conversation_id, MessageRole.AI_AGENT, "offer")
+        
+        conversation = manager.get_conversation(conversation_id)
+        assert conversation.status == ConversationStatus.NEGOTIATING
+        roles = [m.role for m in manager.messages[conversation_id]]
+        assert roles == [MessageRole.CREATOR, MessageRole.SYSTEM, MessageRole.AI_AGENT]
+        assert conversation.message_count == 3
+    
+    asyncio.run(scenario())
+
+
+def test_deal_history_records_only_changed_fields():
+    manager = ConversationManager()
+    conversation_id = _create(manager)
+    
+    manager.update_deal_parameters(conversation_id, {"price": 600, "timeline": "2 weeks"}, "counter")
+    manager.update_deal_parameters(conversation_id, {"price": 600, "revisions": 3}, "revisions")
+    
+    history = manager.deal_history[conversation_id]
+    assert history[0].change_source == "initialization"
+    assert history[0].changes["price"] == 500
+    assert [entry.changes for entry in history[1:]] == [{"price": 600}, {"revisions": 3}]
+    assert [entry.notes for entry in history[1:]] == ["counter", "revisions"]
+    
+    conversation = manager.get_conversation(conversation_id)
+    assert conversation.deal_params["price"] == 600
+    assert conversation.deal_params["revisions"] == 3
+    assert conversation.price_change_count == 1
+
+
+def test_writes_to_unknown_conversations_are_rejected():
+    manager = ConversationManager()
+    
+    assert not manager.add_message("missing", MessageRole.CREATOR, "hello")
+    assert not manager.update_conversation_status("missing", ConversationStatus.PAUSED)
+    assert not manager.update_deal_parameters("missing", {"price": 1}, "")
+    assert manager.flush() == 0
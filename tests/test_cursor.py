@@ -0,0 +1,72 @@
+import base64
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.supabase import supabase
+from app.services.supabase_service import _decode_cursor, _page, _quote, next_cursor, valid_cursor
+
+
+def _rows(n, created_at="2024-05-01T12:00:00+00:00"):
+    return [{"id": f"id-{i}", "created_at": created_at} for i in range(n)]
+
+
+def _encode(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def test_cursor_round_trip():
+    cursor = next_cursor(_rows(3), limit=3)
+    assert _decode_cursor(cursor) == ("2024-05-01T12:00:00+00:00", "id-2")
+
+
+def test_cursor_round_trip_with_null_sort_key():
+    cursor = next_cursor(_rows(2, created_at=None), limit=2)
+    assert _decode_cursor(cursor) == (None, "id-1")
+
+
+def test_no_cursor_after_a_short_page():
+    assert next_cursor(_rows(2), limit=3) is None
+
+
+@pytest.mark.parametrize("cursor", [
+    "not base64 at all!",
+    _encode(b"not json"),
+    _encode(b"{}"),
+    _encode(b'["2024-05-01"]'),
+    _encode(b'["2024-05-01", 5]'),
+    _encode(b'[{"a": 1}, "id-1"]'),
+])
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(ValueError):
+        _decode_cursor(cursor)
+    with pytest.raises(HTTPException) as exc_info:
+        valid_cursor(cursor)
+    assert exc_info.value.status_code == 400
+
+
+def test_valid_cursor_passes_through():
+    cursor = next_cursor(_rows(1), limit=1)
+    assert valid_cursor(cursor) == cursor
+    assert valid_cursor(None) is None
+
+
+def test_quote_escapes_quotes_and_backslashes():
+    assert _quote('a"b\\c,d') == '"a\\"b\\\\c,d"'
+
+
+def test_page_filters_after_the_cursor_row():
+    cursor = next_cursor([{"id": 'x"1', "created_at": "2024-05-01"}], limit=1)
+    query = _page(supabase.table("payments").select("id"), "created_at", 0, 20, cursor)
+    assert query.params["or"] == (
+        '(created_at.lt."2024-05-01",'
+        'and(created_at.eq."2024-05-01",id.lt."x\\"1"))'
+    )
+
+
+def test_page_after_a_null_sort_key_continues_with_non_null_rows():
+    cursor = next_cursor([{"id": "id-1", "created_at": None}], limit=1)
+    query = _page(supabase.table("payments").select("id"), "created_at", 0, 20, cursor)
+    assert query.params["or"] == (
+        '(and(created_at.is.null,id.lt."id-1"),created_at.not.is.null)'
+    )